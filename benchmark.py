@@ -0,0 +1,286 @@
+import os
+import json
+import time
+import random
+import argparse
+import resource
+import tempfile
+import threading
+import contextlib
+import multiprocessing
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+import tag00
+
+DISTRICTS = ["Angul", "Balasore", "Bargarh", "Bhadrak", "Bolangir", "Boudh", "Cuttack", "Deogarh", "Dhenkanal",
+             "Gajapati", "Ganjam", "Jagatsinghpur", "Jajpur", "Jharsuguda", "Kalahandi", "Kandhamal", "Kendrapara",
+             "Keonjhar", "Khordha", "Koraput", "Malkangiri", "Mayurbhanj", "Nabarangpur", "Nayagarh", "Nuapada",
+             "Puri", "Rayagada", "Sambalpur", "Subarnapur", "Sundargarh"]
+
+GSTIN_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+def gstin_check_digit(body):
+    """Return the GSTIN check character for the first 14 characters."""
+    total = 0
+    for position, char in enumerate(body):
+        product = GSTIN_CHARS.index(char) * (2 if position % 2 else 1)
+        total += product // 36 + product % 36
+    return GSTIN_CHARS[(36 - total % 36) % 36]
+
+def synthetic_project(project_id):
+    """Return deterministic synthetic data for one project."""
+    rng = random.Random(project_id)
+    district = rng.randrange(1, len(DISTRICTS) + 1)
+    prefix = rng.choice(["RP", "PS"])
+    promoter = f"{rng.choice(['SHREE', 'NEELACHAL', 'KALINGA', 'UTKAL', 'JAGANNATH'])} " \
+               f"{rng.choice(['INFRA', 'BUILDERS', 'DEVELOPERS', 'HOMES'])} PRIVATE LIMITED"
+    pan = "".join(rng.choice(GSTIN_CHARS[10:]) for _ in range(5)) + f"{rng.randrange(10000):04d}" + rng.choice(GSTIN_CHARS[10:])
+    gst_body = f"21{pan}1Z"
+    return {
+        "id": project_id,
+        "rera_no": f"{prefix}/{district:02d}/{2015 + project_id % 11}/{project_id:05d}",
+        "name": f"{rng.choice(['Basanti', 'Sai', 'Ananta', 'Lotus', 'Green'])} "
+                f"{rng.choice(['Enclave', 'Residency', 'Heights', 'Manor', 'Vihar'])} {project_id}",
+        "promoter": promoter,
+        "district": DISTRICTS[district - 1],
+        "address": f"Plot {rng.randrange(1, 999)}, {DISTRICTS[district - 1]}, Odisha",
+        "gst": gst_body + gstin_check_digit(gst_body)
+    }
+
+POPUP = """<div class="swal2-container"><div class="swal2-popup"><button class="swal2-confirm swal2-styled"
+onclick="this.closest('.swal2-container').remove()">OK</button></div></div>"""
+
+def render_listing(page, per_page, count):
+    """Render one listing page with the card markup the scraper expects."""
+    first = (page - 1) * per_page + 1
+    cards = []
+    for project_id in range(first, min(first + per_page, count + 1)):
+        project = synthetic_project(project_id)
+        cards.append(f"""
+<div class="col-lg-4"><div class="card project-card"><div class="card-body">
+<h5 class="card-title">{project['name']}</h5><small>by {project['promoter']}</small>
+<span class="fw-bold">{project['rera_no']}</span>
+<label>Address</label><strong>{project['district']}</strong>
+<a class="btn btn-primary" href="/projects/project-details/{project_id}">View Details</a>
+</div></div></div>""")
+    pagination = ""
+    if first + per_page <= count:
+        pagination = f'<ul class="pagination"><li class="next"><a href="?page={page + 1}">Next</a></li></ul>'
+    return f"""<html><body>{POPUP}<div class="container"><div class="row">{''.join(cards)}</div>
+{pagination}</div></body></html>"""
+
+def render_detail(project_id):
+    """Render a detail page with the project table and the Promoter Details tab."""
+    project = synthetic_project(project_id)
+    return f"""<html><body>{POPUP}
+<table><tr><th>RERA Regd. No</th><td>{project['rera_no']}</td></tr>
+<tr><th>Project Name</th><td>{project['name']}</td></tr></table>
+<ul class="nav nav-tabs"><li><a href="#promoter" onclick="document.getElementById('promoter').classList.add('active','show')">Promoter Details</a></li></ul>
+<div class="tab-content"><div class="tab-pane" id="promoter"><table>
+<tr><th>Company Name</th><td>{project['promoter']}</td></tr>
+<tr><th>Registered Office Address</th><td>{project['address']}</td></tr>
+<tr><th>GST No</th><td>{project['gst']}</td></tr></table></div></div></body></html>"""
+
+class MockReraServer:
+    """Local stand-in for the RERA Odisha site with injectable latency and failures."""
+    
+    def __init__(self, count=100, per_page=9, latency=0.0, jitter=0.0, failure_rate=0.0, seed=0):
+        self.count = count
+        self.per_page = per_page
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.rng = random.Random(seed)
+        self.detail_requests = {}
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+            
+            def do_GET(self):
+                server.handle(self)
+        
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+    
+    @property
+    def list_url(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}/projects/project-list"
+    
+    def handle(self, request):
+        arrived = time.time()
+        if self.latency or self.jitter:
+            time.sleep(max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter)))
+        path = urlparse(request.path)
+        if self.failure_rate and self.rng.random() < self.failure_rate:
+            self.respond(request, 503, "<html><body>Service Unavailable</body></html>")
+        elif path.path == "/projects/project-list":
+            page = int(parse_qs(path.query).get("page", ["1"])[0])
+            self.respond(request, 200, render_listing(page, self.per_page, self.count))
+        elif path.path.startswith("/projects/project-details/"):
+            project_id = int(path.path.rsplit("/", 1)[1])
+            if not 1 <= project_id <= self.count:
+                self.respond(request, 404, "<html><body>Not Found</body></html>")
+                return
+            self.detail_requests.setdefault(project_id, arrived)
+            self.respond(request, 200, render_detail(project_id))
+        else:
+            self.respond(request, 404, "<html><body>Not Found</body></html>")
+    
+    @staticmethod
+    def respond(request, status, body):
+        data = body.encode("utf-8")
+        request.send_response(status)
+        request.send_header("Content-Type", "text/html; charset=utf-8")
+        request.send_header("Content-Length", str(len(data)))
+        request.end_headers()
+        request.wfile.write(data)
+    
+    def __enter__(self):
+        self.thread.start()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+class TimingSink(tag00.RecordSink):
+    """Sink that only records when each project's record was produced.
+    
+    Given a path (as the queue backend's sink_factory), it appends the timings
+    to that file instead, so worker processes of the queue backend can share it.
+    """
+    
+    def __init__(self, path=None, append=False):
+        super().__init__(path)
+        self.written = []
+        self._file = open(path, "a" if append else "w", encoding="utf-8", buffering=1) if path else None
+    
+    def _write(self, record):
+        if self._file is not None:
+            self._file.write(f"{record['RERA Regd. No']}\t{time.time()!r}\n")
+        else:
+            self.written.append((record["RERA Regd. No"], time.time()))
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+def _run_backend(backend, concurrency, list_url, result_queue):
+    """Scrape the mock site with one backend in this (child) process and report timings.
+    
+    concurrency is the async backend's fetch concurrency, the number of queue
+    workers for http (sequential at 1) and the number of browsers for selenium.
+    """
+    tag00.PACER.min_interval = 0.0
+    tag00.PACER.latency_factor = 0.0
+    sink = TimingSink()
+    start = time.time()
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        if backend == "http" and concurrency > 1:
+            timing_path = os.path.join(tmp, "records.timing")
+            tag00.run_distributed(list_url, os.path.join(tmp, "queue.db"), timing_path, workers=concurrency,
+                                  sink_factory=TimingSink, selenium_fallback=False, poll_interval=0.05)
+            with open(timing_path, encoding="utf-8") as f:
+                sink.written = [(rera_no, float(written_at)) for rera_no, written_at in
+                                (line.rstrip("\n").split("\t") for line in f)]
+        elif backend == "http":
+            tag00.run_http(list_url, None, sink, selenium_fallback=False)
+        elif backend == "async":
+            tag00.run_async(list_url, None, sink, fetch_concurrency=concurrency)
+        elif backend == "selenium":
+            tag00.DRIVER_POOL.max_pages = None
+            if concurrency > 1:
+                tag00.run_selenium_pool(list_url, 10 ** 9, sink, workers=concurrency, direct=True)
+            else:
+                tag00.run_selenium_direct(list_url, float("inf"), sink)
+            tag00.DRIVER_POOL.close()
+    elapsed = time.time() - start
+    result_queue.put({
+        "elapsed": elapsed,
+        "written": sink.written,
+        "peak_rss_mb": max(resource.getrusage(who).ru_maxrss
+                           for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN)) / 1024
+    })
+
+def percentile(values, fraction):
+    """Return the nearest-rank percentile of a list of numbers."""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))]
+
+def benchmark(backend, concurrency, server):
+    """Run one backend/concurrency combination against the mock server and summarise it."""
+    server.detail_requests.clear()
+    result_queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_run_backend, args=(backend, concurrency, server.list_url, result_queue))
+    process.start()
+    
+    peak_tree_mb = [0.0]
+    finished = threading.Event()
+    
+    def sample_rss():
+        while not finished.wait(0.05):
+            peak_tree_mb[0] = max(peak_tree_mb[0], tag00.MemoryWatchdog.rss_mb(process.pid) or 0.0)
+    
+    sampler = threading.Thread(target=sample_rss, daemon=True)
+    sampler.start()
+    result = result_queue.get()
+    finished.set()
+    sampler.join()
+    process.join()
+    
+    rera_to_id = {synthetic_project(project_id)["rera_no"]: project_id for project_id in server.detail_requests}
+    latencies = [written_at - server.detail_requests[rera_to_id[rera_no]]
+                 for rera_no, written_at in result["written"] if rera_no in rera_to_id]
+    return {
+        "backend": backend,
+        "concurrency": concurrency,
+        "records": len(result["written"]),
+        "seconds": result["elapsed"],
+        "records_per_sec": len(result["written"]) / result["elapsed"] if result["elapsed"] else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "peak_rss_mb": max(result["peak_rss_mb"], peak_tree_mb[0])
+    }
+
+def main():
+    """Benchmark the scraper backends against a local mock RERA site."""
+    parser = argparse.ArgumentParser(description="Offline benchmark of the RERA scraper against a local mock site.")
+    parser.add_argument("--projects", type=int, default=500, help="number of synthetic projects (10 to 50000)")
+    parser.add_argument("--per-page", type=int, default=9, help="project cards per listing page")
+    parser.add_argument("--latency", type=float, default=0.0, help="injected server latency per request, in ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random +/- jitter added to the latency, in ms")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="fraction of requests answered with HTTP 503")
+    parser.add_argument("--backends", nargs="+", default=["http", "async"], choices=["http", "async", "selenium"])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32],
+                        help="concurrency settings to try for every backend: async fetches in flight, "
+                             "http queue workers, selenium browsers")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args()
+    
+    if not 10 <= args.projects <= 50000:
+        parser.error("--projects must be between 10 and 50000")
+    
+    results = []
+    with MockReraServer(args.projects, args.per_page, args.latency / 1000, args.jitter / 1000, args.failure_rate) as server:
+        print(f"Mock RERA site with {args.projects} projects at {server.list_url}")
+        for backend in args.backends:
+            for concurrency in args.concurrency:
+                result = benchmark(backend, concurrency, server)
+                results.append(result)
+                print(f"{result['backend']:<10}{result['concurrency']:>5}{result['records']:>8} records"
+                      f"{result['seconds']:>9.2f}s{result['records_per_sec']:>10.1f} rec/s"
+                      f"  p50 {result['p50_ms']:>8.1f}ms  p99 {result['p99_ms']:>8.1f}ms"
+                      f"  peak RSS {result['peak_rss_mb']:>7.1f}MB")
+    
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
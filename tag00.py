@@ -1,4 +1,5 @@
 import time
+import numpy as np
 import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -7,11 +8,156 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException, StaleElementReferenceException, WebDriverException, SessionNotCreatedException
+from selenium.common.exceptions import (InvalidSelectorException, JavascriptException, ElementNotInteractableException,
+                                        InvalidElementStateException, MoveTargetOutOfBoundsException,
+                                        InvalidSessionIdException, NoSuchWindowException)
+import urllib3
 import re
+import os
+import sys
+import gc
+import math
+import random
+import csv
+import json
+import sqlite3
+import hashlib
+from datetime import datetime, timezone, timedelta
+import queue
+import threading
+import multiprocessing
+import platform
+import asyncio
+import concurrent.futures
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+from contextlib import contextmanager
+from functools import lru_cache
+from urllib.parse import urljoin, urlparse, urlencode, parse_qsl, urlunparse
+import requests
+from requests.adapters import HTTPAdapter
+from lxml import etree
+from lxml import html as lxml_html
 
-def setup_driver():
-    """Set up and return a Chrome WebDriver with headless options."""
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+BASE_URL = "https://rera.odisha.gov.in/projects/project-list"
+DETAIL_URL_TEMPLATE = "https://rera.odisha.gov.in/projects/project-details/{project_id}"
+
+RECORD_FIELDS = ["RERA Regd. No", "Project Name", "Promoter Name", "Address of the Promoter", "GST No"]
+
+PROJECT_SELECTORS = [
+    "//div[contains(@class, 'project-card')]",
+    "//div[contains(@class, 'card') and contains(@class, 'project-card')]",
+    "//div[contains(@class, 'container')]/div[contains(@class, 'row')]/div[contains(@class, 'col-lg-4')]",
+    "//div[contains(@class, 'card')]"
+]
+
+PROMOTER_TAB_SELECTORS = [
+    "//a[contains(text(), 'Promoter Details')]",
+    "//li/a[contains(text(), 'Promoter')]",
+    "//div[contains(@class, 'tab')]/a[contains(text(), 'Promoter')]"
+]
+
+# Field extraction rules, each a list of XPaths tried in declared fallback order.
+DETAIL_RULES = {
+    "RERA Regd. No": [
+        "//th[contains(text(), 'RERA Regd. No')]/following-sibling::td"
+    ],
+    "Project Name": [
+        "//th[contains(text(), 'Project Name')]/following-sibling::td"
+    ],
+    "Promoter Name": [
+        "//th[contains(text(), 'Company Name')]/following-sibling::td",
+        "//th[contains(text(), 'Promoter Name')]/following-sibling::td",
+        "//th[contains(text(), 'Name of Promoter')]/following-sibling::td",
+        "//th[contains(text(), 'Company')]/following-sibling::td"
+    ],
+    "Address of the Promoter": [
+        "//th[contains(text(), 'Registered Office Address')]/following-sibling::td",
+        "//th[contains(text(), 'Office Address')]/following-sibling::td",
+        "//th[contains(text(), 'Address')]/following-sibling::td"
+    ],
+    "GST No": [
+        "//th[contains(text(), 'GST No')]/following-sibling::td",
+        "//th[contains(text(), 'GST Number')]/following-sibling::td",
+        "//th[contains(text(), 'GSTIN')]/following-sibling::td"
+    ]
+}
+
+CARD_RULES = {
+    "rera_no": [".//span[contains(concat(' ', normalize-space(@class), ' '), ' fw-bold ')]"],
+    "project_name": [".//h5[contains(concat(' ', normalize-space(@class), ' '), ' card-title ')]"],
+    "promoter": [".//small"],
+    "address": [".//label[contains(text(), 'Address')]/following-sibling::strong"]
+}
+
+DRIVER_PATH_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "tag00", "chromedriver_path")
+
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*facebook.net*", "*hotjar.com*"
+]
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+def resolve_driver_path(refresh=False):
+    """Return the chromedriver binary path, resolving it with webdriver-manager at most once.
+    
+    The resolved path is kept in DRIVER_PATH_CACHE so later runs skip the version lookup.
+    refresh=True drops the cached path (e.g. after Chrome updated) and resolves it again.
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if refresh:
+            _driver_path = None
+            try:
+                os.remove(DRIVER_PATH_CACHE)
+            except OSError:
+                pass
+        if _driver_path and os.path.exists(_driver_path):
+            return _driver_path
+        try:
+            with open(DRIVER_PATH_CACHE, encoding="utf-8") as f:
+                cached_path = f.read().strip()
+            if cached_path and os.access(cached_path, os.X_OK):
+                _driver_path = cached_path
+                return _driver_path
+        except OSError:
+            pass
+        
+        _driver_path = ChromeDriverManager().install()
+        try:
+            os.makedirs(os.path.dirname(DRIVER_PATH_CACHE), exist_ok=True)
+            with open(DRIVER_PATH_CACHE, "w", encoding="utf-8") as f:
+                f.write(_driver_path)
+        except OSError as e:
+            print(f"Could not cache chromedriver path: {str(e)}")
+        return _driver_path
+
+def setup_driver(block_resources=True):
+    """Set up and return a Chrome WebDriver with headless options.
+    
+    With block_resources, images, fonts and analytics requests are blocked through CDP.
+    """
     chrome_options = Options()
     chrome_options.add_argument("--headless") 
     chrome_options.add_argument("--no-sandbox")
@@ -19,35 +165,720 @@ def setup_driver():
     chrome_options.add_argument("--window-size=1920,1080") 
     chrome_options.add_argument("--start-maximized")  
     chrome_options.add_argument("--disable-notifications") 
+    if block_resources:
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
     
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
+    try:
+        driver = webdriver.Chrome(service=Service(resolve_driver_path()), options=chrome_options)
+    except SessionNotCreatedException as e:
+        print(f"Could not start Chrome with the cached chromedriver, resolving it again: {e.msg}")
+        driver = webdriver.Chrome(service=Service(resolve_driver_path(refresh=True)), options=chrome_options)
+    if block_resources:
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except WebDriverException as e:
+            print(f"Could not enable request blocking: {str(e)}")
     return driver
 
-def handle_popup(driver):
+class DriverPool:
+    """Pool of warm, pre-configured WebDrivers that are recycled after max_pages pages.
+    
+    A forked child process starts with an empty pool; the parent's browser
+    sessions are never handed to (or quit by) a child.
+    """
+    
+    def __init__(self, max_pages=50, block_resources=True):
+        self.max_pages = max_pages
+        self.block_resources = block_resources
+        self._forget_drivers()
+    
+    def _forget_drivers(self):
+        self._pid = os.getpid()
+        self._idle = []
+        self._pages = {}
+        self._expired = set()
+        self._lock = threading.Lock()
+    
+    def _check_process(self):
+        """Start from an empty pool when called in a process forked from the pool's owner."""
+        if os.getpid() != self._pid:
+            self._forget_drivers()
+    
+    def _start(self):
+        driver = setup_driver(self.block_resources)
+        with self._lock:
+            self._pages[id(driver)] = 0
+        return driver
+    
+    def warm(self, count):
+        """Start drivers in parallel until count of them are idle in the pool."""
+        self._check_process()
+        with self._lock:
+            missing = count - len(self._idle)
+        if missing <= 0:
+            return
+        started = []
+        threads = [threading.Thread(target=lambda: started.append(self._start())) for _ in range(missing)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with self._lock:
+            self._idle.extend(started)
+    
+    def acquire(self):
+        """Return an idle warm driver, starting a new one if none is free."""
+        self._check_process()
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._start()
+    
+    def track(self, driver, pages=1):
+        """Count pages served by driver; return True once it is due for recycling.
+        
+        A driver that was already discarded is always due.
+        """
+        self._check_process()
+        MEMORY_WATCHDOG.check()
+        with self._lock:
+            if id(driver) in self._pages:
+                self._pages[id(driver)] += pages
+            return self._worn_out(driver)
+    
+    def owns(self, driver):
+        """Return True while driver is a live driver of this pool, i.e. started and not discarded."""
+        self._check_process()
+        with self._lock:
+            return id(driver) in self._pages
+    
+    def _worn_out(self, driver):
+        if id(driver) not in self._pages or id(driver) in self._expired:
+            return True
+        return self.max_pages is not None and self._pages[id(driver)] >= self.max_pages
+    
+    def expire_all(self):
+        """Quit idle drivers and mark those in use for recycling at their next page."""
+        self._check_process()
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._expired.update(self._pages)
+        for driver in idle:
+            self.discard(driver)
+    
+    def release(self, driver):
+        """Return a driver to the pool, or quit it if it has served its page budget."""
+        self._check_process()
+        if driver is None:
+            return
+        with self._lock:
+            worn_out = self._worn_out(driver)
+        if worn_out:
+            self.discard(driver)
+            return
+        try:
+            close_other_windows(driver, driver.window_handles[0])
+        except WebDriverException:
+            self.discard(driver)
+            return
+        with self._lock:
+            self._idle.append(driver)
+    
+    def discard(self, driver):
+        """Quit a (possibly crashed) driver and forget it."""
+        with self._lock:
+            self._pages.pop(id(driver), None)
+            self._expired.discard(id(driver))
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    def close(self):
+        """Quit every idle driver."""
+        self._check_process()
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self.discard(driver)
+
+DRIVER_POOL = DriverPool()
+
+def discard_if_crashed(driver, exc):
+    """Quit driver if exc shows its browser session is gone; return True if it was discarded."""
+    if driver is None or classify_failure(exc) != "driver_crash":
+        return False
+    print("Browser session lost, starting a new one")
+    DRIVER_POOL.discard(driver)
+    return True
+
+def close_other_windows(driver, keep):
+    """Close every browser window except keep and switch back to it."""
+    for handle in driver.window_handles:
+        if handle != keep:
+            driver.switch_to.window(handle)
+            driver.close()
+    driver.switch_to.window(keep)
+
+class Metrics:
+    """Run instrumentation: timed spans per phase and labelled counters.
+    
+    Spans from parser worker processes of the async backend are not collected.
+    """
+    
+    def __init__(self):
+        self._spans = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+        self.started = time.monotonic()
+    
+    @contextmanager
+    def span(self, name):
+        """Time the enclosed block under name."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+    
+    def add_time(self, name, seconds):
+        with self._lock:
+            span = self._spans.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0})
+            span["count"] += 1
+            span["total"] += seconds
+            span["max"] = max(span["max"], seconds)
+    
+    def incr(self, name, amount=1, **labels):
+        """Add amount to the counter name with the given labels."""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+    
+    def snapshot(self):
+        """Return spans and counters as plain data."""
+        with self._lock:
+            return {
+                "elapsed_seconds": time.monotonic() - self.started,
+                "spans": {name: dict(span) for name, span in self._spans.items()},
+                "counters": [{"name": name, "labels": dict(labels), "value": value}
+                             for (name, labels), value in sorted(self._counters.items())]
+            }
+    
+    def report(self):
+        """Return a human-readable end-of-run timing report."""
+        data = self.snapshot()
+        lines = [f"Run time: {data['elapsed_seconds']:.1f}s",
+                 f"{'phase':<36}{'count':>8}{'total s':>10}{'mean s':>10}{'max s':>10}"]
+        for name, span in sorted(data["spans"].items(), key=lambda item: -item[1]["total"]):
+            lines.append(f"{name:<36}{span['count']:>8}{span['total']:>10.2f}"
+                         f"{span['total'] / span['count']:>10.3f}{span['max']:>10.3f}")
+        if data["counters"]:
+            lines.append("")
+            for counter in data["counters"]:
+                labels = ", ".join(f"{k}={v}" for k, v in counter["labels"].items())
+                lines.append(f"{counter['name']}{' [' + labels + ']' if labels else ''}: {counter['value']}")
+        return "\n".join(lines)
+    
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2, ensure_ascii=False)
+    
+    def to_prometheus(self, prefix="rera_scraper"):
+        """Return the metrics in the Prometheus text exposition format."""
+        def label_text(labels):
+            escaped = (f'{k}="{str(v).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+                       for k, v in labels.items())
+            return "{" + ",".join(escaped) + "}"
+        
+        data = self.snapshot()
+        lines = [f"# TYPE {prefix}_run_seconds gauge", f"{prefix}_run_seconds {data['elapsed_seconds']:.6f}",
+                 f"# TYPE {prefix}_span_seconds summary"]
+        for name, span in sorted(data["spans"].items()):
+            lines.append(f"{prefix}_span_seconds_sum{label_text({'span': name})} {span['total']:.6f}")
+            lines.append(f"{prefix}_span_seconds_count{label_text({'span': name})} {span['count']}")
+        seen = set()
+        for counter in data["counters"]:
+            metric = f"{prefix}_{counter['name']}_total"
+            if metric not in seen:
+                lines.append(f"# TYPE {metric} counter")
+                seen.add(metric)
+            lines.append(f"{metric}{label_text(counter['labels']) if counter['labels'] else ''} {counter['value']}")
+        return "\n".join(lines) + "\n"
+
+METRICS = Metrics()
+
+class MemoryWatchdog:
+    """Keeps long runs under a memory limit by watching the RSS of this process and its children.
+    
+    Chrome and chromedriver run as child processes, so their memory counts too.
+    Checks run at most every interval seconds. Over the limit, browsers are
+    recycled, output buffers flushed and Python garbage collected. Memory is read
+    from /proc, or through psutil where there is no /proc (Windows, macOS).
+    """
+    
+    def __init__(self, limit_mb=None, interval=5.0):
+        self.limit_mb = limit_mb
+        self.interval = interval
+        self.events = 0
+        self._next_check = 0.0
+        self._warned = False
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def rss_mb(pid=None):
+        """Return the resident memory of pid (default: this process) plus its descendants in MB.
+        
+        Returns None when memory cannot be measured on this platform.
+        """
+        pid = pid or os.getpid()
+        try:
+            parents = {}
+            for entry in os.listdir("/proc"):
+                if entry.isdigit():
+                    try:
+                        with open(f"/proc/{entry}/stat") as f:
+                            parents[int(entry)] = int(f.read().rsplit(")", 1)[1].split()[1])
+                    except (OSError, IndexError, ValueError):
+                        continue
+        except OSError:
+            return MemoryWatchdog._psutil_rss_mb(pid)
+        tree, frontier = set(), [pid]
+        while frontier:
+            current = frontier.pop()
+            tree.add(current)
+            frontier.extend(child for child, parent in parents.items() if parent == current and child not in tree)
+        pages = 0
+        for member in tree:
+            try:
+                with open(f"/proc/{member}/statm") as f:
+                    pages += int(f.read().split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    
+    @staticmethod
+    def _psutil_rss_mb(pid):
+        if psutil is None:
+            return None
+        try:
+            process = psutil.Process(pid)
+            tree = [process] + process.children(recursive=True)
+        except psutil.Error:
+            return None
+        total = 0
+        for member in tree:
+            try:
+                total += member.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+    
+    def check(self):
+        """Return True (after recycling and collecting) if memory is over the limit."""
+        if self.limit_mb is None:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if now < self._next_check:
+                return False
+            self._next_check = now + self.interval
+        rss = self.rss_mb()
+        if rss is None:
+            if not self._warned:
+                self._warned = True
+                print("Cannot measure memory use on this platform (pip install psutil); --memory-limit is not enforced")
+            return False
+        if rss < self.limit_mb:
+            return False
+        METRICS.incr("memory_pressure")
+        print(f"Memory at {rss:.0f} MB (limit {self.limit_mb:.0f} MB): recycling browsers and flushing output")
+        self.events += 1
+        DRIVER_POOL.expire_all()
+        gc.collect()
+        return True
+
+MEMORY_WATCHDOG = MemoryWatchdog()
+
+class SharedValue:
+    """Numeric attribute that share_state() can move into memory shared with forked processes."""
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        shared = obj.__dict__.get("_shared")
+        if shared is None:
+            return obj.__dict__[self.name]
+        value = shared[0][shared[1][self.name]]
+        return None if math.isnan(value) else value
+    
+    def __set__(self, obj, value):
+        shared = obj.__dict__.get("_shared")
+        if shared is None:
+            obj.__dict__[self.name] = value
+        else:
+            shared[0][shared[1][self.name]] = math.nan if value is None else value
+
+def share_state(obj):
+    """Move obj's SharedValue attributes and its lock into shared memory.
+    
+    Worker processes forked afterwards then pace and count against one common
+    state instead of each getting a private copy.
+    """
+    if "_shared" in obj.__dict__:
+        return
+    names = [name for name, attr in vars(type(obj)).items() if isinstance(attr, SharedValue)]
+    values = [getattr(obj, name) for name in names]
+    array = multiprocessing.Array("d", [math.nan if value is None else value for value in values])
+    obj.__dict__["_shared"] = (array, {name: i for i, name in enumerate(names)})
+    obj._lock = array.get_lock()
+
+class Pacer:
+    """Global request pacing that adapts to the server's measured response latency."""
+    
+    avg_latency = SharedValue()
+    _next_slot = SharedValue()
+    
+    def __init__(self, min_interval=0.5, max_interval=10.0, latency_factor=1.0, smoothing=0.3):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.latency_factor = latency_factor
+        self.smoothing = smoothing
+        self.avg_latency = None
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def interval(self):
+        """Return the current gap enforced between two requests."""
+        if self.avg_latency is None:
+            return self.min_interval
+        return min(self.max_interval, max(self.min_interval, self.avg_latency * self.latency_factor))
+    
+    def reserve(self):
+        """Reserve the next request slot and return how many seconds to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval()
+        return slot - now
+    
+    def wait(self):
+        """Block until the next request slot is free, then reserve it."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    def record(self, latency):
+        """Fold one measured response latency (in seconds) into the moving average."""
+        with self._lock:
+            if self.avg_latency is None:
+                self.avg_latency = latency
+            else:
+                self.avg_latency = self.smoothing * latency + (1 - self.smoothing) * self.avg_latency
+
+PACER = Pacer()
+
+RETRYABLE_FAILURES = {"timeout", "stale_dom", "server_error", "connection", "driver_crash"}
+
+MARKUP_ERRORS = (NoSuchElementException, InvalidSelectorException, JavascriptException, ElementClickInterceptedException,
+                 ElementNotInteractableException, InvalidElementStateException, MoveTargetOutOfBoundsException)
+
+DRIVER_LOST_MESSAGES = ("chrome not reachable", "disconnected", "session deleted", "tab crashed", "no such window",
+                        "invalid session id", "target window already closed")
+
+def classify_failure(exc):
+    """Return the failure category of an exception raised while scraping a project."""
+    if isinstance(exc, MARKUP_ERRORS):
+        return "markup_change"
+    if isinstance(exc, StaleElementReferenceException):
+        return "stale_dom"
+    if isinstance(exc, (TimeoutException, requests.Timeout, asyncio.TimeoutError, TimeoutError)):
+        return "timeout"
+    status = None
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        status = exc.response.status_code
+    elif aiohttp is not None and isinstance(exc, aiohttp.ClientResponseError):
+        status = exc.status
+    if status is not None:
+        return "server_error" if status >= 500 or status == 429 else "client_error"
+    if isinstance(exc, requests.ConnectionError) or (aiohttp is not None and isinstance(exc, aiohttp.ClientConnectionError)):
+        return "connection"
+    if isinstance(exc, (InvalidSessionIdException, NoSuchWindowException, urllib3.exceptions.HTTPError)):
+        return "driver_crash"
+    if isinstance(exc, WebDriverException) and any(text in (exc.msg or "").lower() for text in DRIVER_LOST_MESSAGES):
+        return "driver_crash"
+    return "unknown"
+
+class RetryBudget:
+    """Global cap on retries: minimum plus ratio times the number of first attempts."""
+    
+    attempts = SharedValue()
+    retries = SharedValue()
+    
+    def __init__(self, ratio=0.2, minimum=10):
+        self.ratio = ratio
+        self.minimum = minimum
+        self.attempts = 0
+        self.retries = 0
+        self._lock = threading.Lock()
+    
+    def record_attempt(self):
+        with self._lock:
+            self.attempts += 1
+    
+    def spend(self):
+        """Take one retry from the budget; return False when it is exhausted."""
+        with self._lock:
+            if self.retries >= self.minimum + self.ratio * self.attempts:
+                return False
+            self.retries += 1
+            return True
+
+class CircuitBreaker:
+    """Pause the crawl after repeated site failures, then probe with one request.
+    
+    After failure_threshold consecutive failures the breaker opens and callers
+    block for cooldown seconds; the first call after that is a trial, and a
+    success closes the breaker while another failure opens it again.
+    """
+    
+    failures = SharedValue()
+    open_until = SharedValue()
+    
+    def __init__(self, failure_threshold=5, cooldown=60.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.open_until = 0.0
+        self._lock = threading.Lock()
+    
+    def delay(self):
+        """Return how long a caller must still wait before the next request."""
+        with self._lock:
+            return max(0.0, self.open_until - time.monotonic())
+    
+    def wait(self):
+        delay = self.delay()
+        if delay > 0:
+            print(f"Circuit breaker open, pausing crawl for {delay:.0f}s")
+            time.sleep(delay)
+    
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+    
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold and self.open_until <= time.monotonic():
+                self.open_until = time.monotonic() + self.cooldown
+                self.failures = self.failure_threshold - 1
+                METRICS.incr("circuit_open")
+                print(f"Site looks degraded after {self.failure_threshold} failures, opening circuit breaker")
+
+class RetryPolicy:
+    """Failure classification, exponential backoff with jitter, retry budget and circuit breaker."""
+    
+    def __init__(self, max_attempts=3, base_delay=1.0, max_delay=30.0, budget=None, breaker=None):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget or RetryBudget()
+        self.breaker = breaker or CircuitBreaker()
+    
+    def share(self):
+        """Share the retry budget and circuit breaker with worker processes forked after this call."""
+        share_state(self.budget)
+        share_state(self.breaker)
+    
+    def backoff(self, attempt):
+        """Return the delay before retry number attempt + 1 (exponential, equal jitter)."""
+        delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return delay / 2 + random.uniform(0, delay / 2)
+    
+    def before_attempt(self, attempt):
+        """Wait for the circuit breaker and count first attempts towards the budget."""
+        self.breaker.wait()
+        if attempt == 0:
+            self.budget.record_attempt()
+    
+    def on_success(self):
+        self.breaker.record_success()
+    
+    def on_failure(self, exc, attempt):
+        """Classify a failure and return the seconds to back off before retrying, or None to give up."""
+        category = classify_failure(exc)
+        METRICS.incr("failure", category=category)
+        if category in {"timeout", "server_error", "connection"}:
+            self.breaker.record_failure()
+        if category not in RETRYABLE_FAILURES or attempt + 1 >= self.max_attempts:
+            return None
+        if not self.budget.spend():
+            METRICS.incr("retry_budget_exhausted")
+            print("Retry budget exhausted, not retrying")
+            return None
+        METRICS.incr("retry", category=category)
+        return self.backoff(attempt)
+
+RETRY_POLICY = RetryPolicy()
+
+def retry_call(func, *args, **kwargs):
+    """Call func under RETRY_POLICY, retrying retryable failures with backoff."""
+    attempt = 0
+    while True:
+        RETRY_POLICY.before_attempt(attempt)
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            delay = RETRY_POLICY.on_failure(e, attempt)
+            if delay is None:
+                raise
+            print(f"{classify_failure(e)} failure, retrying in {delay:.1f}s: {str(e)}")
+            time.sleep(delay)
+            attempt += 1
+            continue
+        RETRY_POLICY.on_success()
+        return result
+
+async def retry_call_async(func, *args, **kwargs):
+    """Await func under RETRY_POLICY, retrying retryable failures with backoff."""
+    attempt = 0
+    while True:
+        await asyncio.sleep(RETRY_POLICY.breaker.delay())
+        if attempt == 0:
+            RETRY_POLICY.budget.record_attempt()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            delay = RETRY_POLICY.on_failure(e, attempt)
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
+            attempt += 1
+            continue
+        RETRY_POLICY.on_success()
+        return result
+
+def wait_for_page_ready(driver, timeout=15, idle_time=0.5):
+    """Wait until the document has loaded and no new network requests start for idle_time seconds."""
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+        script = """
+        var pending = (window.jQuery && window.jQuery.active) || 0;
+        return [performance.getEntriesByType('resource').length, pending];
+        """
+        deadline = time.monotonic() + timeout
+        last_count, idle_since = None, time.monotonic()
+        while time.monotonic() < deadline:
+            count, pending = driver.execute_script(script)
+            if count != last_count or pending:
+                last_count, idle_since = count, time.monotonic()
+            elif time.monotonic() - idle_since >= idle_time:
+                return True
+            time.sleep(0.1)
+    except TimeoutException:
+        print("Timed out waiting for page to become ready")
+    return False
+
+def paced_get(driver, url, timeout=15):
+    """Load a URL through the global pacer and wait for the page to settle."""
+    PACER.wait()
+    start = time.monotonic()
+    with METRICS.span("page_load"):
+        driver.get(url)
+        wait_for_page_ready(driver, timeout)
+    PACER.record(time.monotonic() - start)
+
+def wait_for_any(driver, xpaths, timeout=5, clickable=False, field="element"):
+    """Wait once for the first element matching any XPath, checked in fallback order.
+    
+    Returns None when nothing matches within timeout, instead of waiting out each selector.
+    Each rule is counted once under the same "selector" labels as extract_fields:
+    the matching rule as a hit and the rules before it (all of them on timeout) as misses.
+    """
+    matched = []
+    
+    def find(d):
+        for rule, xpath in enumerate(xpaths):
+            for element in d.find_elements(By.XPATH, xpath):
+                if not clickable or (element.is_displayed() and element.is_enabled()):
+                    matched.append(rule)
+                    return element
+        return False
+    
+    try:
+        with METRICS.span("selector_wait"):
+            return WebDriverWait(driver, timeout, ignored_exceptions=[StaleElementReferenceException]).until(find)
+    except TimeoutException:
+        return None
+    finally:
+        hit = matched[0] if matched else len(xpaths)
+        for rule in range(min(hit + 1, len(xpaths))):
+            METRICS.incr("selector", field=field, rule=rule, result="hit" if rule == hit else "miss")
+
+def wait_for_new_window(driver, original_handles, timeout=10):
+    """Wait for a new window handle to appear and return it, or None if none opened."""
+    try:
+        WebDriverWait(driver, timeout).until(lambda d: len(d.window_handles) > len(original_handles))
+    except TimeoutException:
+        return None
+    return [h for h in driver.window_handles if h not in original_handles][0]
+
+def wait_for_tab_pane(driver, timeout=10):
+    """Wait until the active tab pane is visible and has rendered its table."""
+    return wait_for_any(driver, [
+        "//div[contains(@class, 'tab-pane') and contains(@class, 'active')]//th",
+        "//div[contains(@class, 'tab-pane') and contains(@class, 'show')]//th"
+    ], timeout, clickable=True, field="tab_pane") is not None
+
+def handle_popup(driver, timeout=3):
     """Handle the popup that appears when the page loads."""
+    with METRICS.span("popup"):
+        return _handle_popup(driver, timeout)
+
+def _handle_popup(driver, timeout):
     try:
-        ok_button = WebDriverWait(driver, 10).until(
+        ok_button = WebDriverWait(driver, timeout).until(
             EC.element_to_be_clickable((By.CSS_SELECTOR, "button.swal2-confirm.swal2-styled"))
         )
         print("Found popup, clicking OK button")
         ok_button.click()
-        time.sleep(1)  
+        WebDriverWait(driver, 5).until(
+            EC.invisibility_of_element_located((By.CSS_SELECTOR, "div.swal2-container"))
+        )
         return True
     except (TimeoutException, NoSuchElementException) as e:
         print("No popup found or could not close popup")
         return False
 
-def safe_get_element_text(driver, xpath, wait_time=10, default="Not found"):
-    """Safely get the text of an element with error handling."""
-    try:
-        element = WebDriverWait(driver, wait_time).until(
-            EC.presence_of_element_located((By.XPATH, xpath))
-        )
-        return element.text.strip() if element.text else default
-    except (TimeoutException, NoSuchElementException) as e:
-        print(f"Element not found: {xpath} - {str(e)}")
-        return default
+def project_id_from_href(href):
+    """Return the numeric project ID in a detail link (?id=123 or a trailing /123), or None."""
+    match = re.search(r'id=(\d+)', href) or re.search(r'/(\d+)/?(?:[?#].*)?$', href)
+    return match.group(1) if match else None
+
+def content_project_id(text):
+    """Return a deterministic placeholder ID derived from a card's text content."""
+    normalised = " ".join(text.split()).upper()
+    return "project_" + hashlib.sha1(normalised.encode("utf-8")).hexdigest()[:12]
+
+def stable_project_key(card):
+    """Return the identity used to deduplicate a project across selectors, pages and runs.
+    
+    This is the RERA registration number with whitespace removed, or a hash of
+    the card's name, promoter and address when the card shows no number.
+    """
+    rera_no = card.get("rera_no") or ""
+    if rera_no and rera_no != "Not found":
+        return re.sub(r"\s+", "", rera_no).upper()
+    if not card["project_id"].startswith("project_"):
+        return f"id:{card['project_id']}"
+    content = "|".join(card.get(field) or "" for field in ["project_name", "promoter", "address"])
+    return "card:" + hashlib.sha1(" ".join(content.split()).upper().encode("utf-8")).hexdigest()[:16]
 
 def get_project_id_from_element(project_element):
     """Extract project ID from the project element if possible."""
@@ -60,17 +891,103 @@ def get_project_id_from_element(project_element):
         view_details_link = project_element.find_element(By.TAG_NAME, "a")
         href = view_details_link.get_attribute('href')
         if href:
-            match = re.search(r'id=(\d+)', href)
-            if match:
-                return match.group(1)
+            project_id = project_id_from_href(href)
+            if project_id:
+                return project_id
     except:
         pass
     
-    import random
-    return f"project_{random.randint(1000, 9999)}"
+    try:
+        return content_project_id(project_element.text)
+    except WebDriverException:
+        return content_project_id("")
+
+def _node_text(node):
+    """Return the whitespace-normalised text content of an lxml node."""
+    if hasattr(node, "text_content"):
+        return " ".join(node.text_content().split())
+    return " ".join(str(node).split())
+
+@lru_cache(maxsize=None)
+def _compiled_xpath(expression):
+    """Compile an XPath expression once and reuse it for every page."""
+    return etree.XPath(expression)
+
+def extract_fields(source, rules=DETAIL_RULES, default="Not found"):
+    """Resolve every field in rules against one parsed document in a single pass.
+    
+    source is an HTML string or an already parsed lxml element.
+    """
+    root = lxml_html.fromstring(source) if isinstance(source, (str, bytes)) else source
+    result = {}
+    for field, xpaths in rules.items():
+        result[field] = default
+        with METRICS.span(f"extract:{field}"):
+            for rule, xpath in enumerate(xpaths):
+                text = next((t for t in map(_node_text, _compiled_xpath(xpath)(root)) if t), None)
+                if text:
+                    METRICS.incr("selector", field=field, rule=rule, result="hit")
+                    result[field] = text
+                    break
+                METRICS.incr("selector", field=field, rule=rule, result="miss")
+    return result
+
+def parse_card(element, index=0, base_url=BASE_URL):
+    """Parse one project card element (lxml) into a card dictionary.
+    
+    The promoter and the card's address (its district) repeat across many cards
+    and are interned.
+    """
+    project_id = None
+    for attr in ['data-id', 'id', 'data-project-id']:
+        if element.get(attr):
+            project_id = element.get(attr)
+            break
+    
+    detail_url = None
+    for link in element.xpath(".//a[@href]"):
+        href = link.get("href").strip()
+        if href and not href.startswith("javascript:") and href != "#":
+            detail_url = urljoin(base_url, href)
+            break
+    
+    if not project_id and detail_url:
+        project_id = project_id_from_href(detail_url)
+    
+    card = extract_fields(element, CARD_RULES)
+    if card["promoter"].lower().startswith("by "):
+        card["promoter"] = card["promoter"][3:].strip()
+    card["promoter"] = sys.intern(card["promoter"])
+    card["address"] = sys.intern(card["address"])
+    card["project_id"] = project_id or content_project_id(_node_text(element))
+    card["detail_url"] = detail_url
+    return card
+
+def parse_project_cards(page_html, base_url=BASE_URL):
+    """Parse the project list HTML into card dictionaries."""
+    with METRICS.span("card_discovery"):
+        root = lxml_html.fromstring(page_html)
+        elements = []
+        for selector in PROJECT_SELECTORS:
+            elements = _compiled_xpath(selector)(root)
+            if elements:
+                break
+        return [parse_card(element, idx, base_url) for idx, element in enumerate(elements)]
+
+def parse_card_element(project_element):
+    """Parse a Selenium card element in-process from a single outerHTML round-trip."""
+    return parse_card(lxml_html.fromstring(project_element.get_attribute("outerHTML")))
+
+def parse_project_details(page_html):
+    """Parse a detail page (including the Promoter Details pane) into a record."""
+    return extract_fields(page_html, DETAIL_RULES)
 
 def scrape_project_details(driver, project_element, project_index):
-    """Scrape the details of a project directly from the element or by clicking on it."""
+    """Scrape the details of a project directly from the element or by clicking on it.
+    
+    Retryable failures (timeouts, stale DOM, driver errors) are re-raised for the
+    caller's retry policy; anything else is logged and returns None.
+    """
     try:
         project_id = get_project_id_from_element(project_element)
         print(f"Processing project {project_index} with ID: {project_id}")
@@ -93,26 +1010,7 @@ def scrape_project_details(driver, project_element, project_index):
             print(f"No view details button found for project {project_index}")
             try:
                 print("Attempting to extract data from project card directly")
-                rera_no = project_element.find_element(By.CSS_SELECTOR, "span.fw-bold").text.strip()
-                project_name = project_element.find_element(By.CSS_SELECTOR, "h5.card-title").text.strip()
-                promoter = project_element.find_element(By.CSS_SELECTOR, "small").text.strip()
-                if promoter.lower().startswith("by "):
-                    promoter = promoter[3:].strip()
-                
-                address = "Not found"
-                try:
-                    address_element = project_element.find_element(By.XPATH, ".//label[contains(text(), 'Address')]/following-sibling::strong")
-                    address = address_element.text.strip()
-                except:
-                    pass
-                
-                return {
-                    "RERA Regd. No": rera_no,
-                    "Project Name": project_name,
-                    "Promoter Name": promoter,
-                    "Address of the Promoter": address,
-                    "GST No": "Not available without detail page"
-                }
+                return card_to_record(parse_card_element(project_element))
             except Exception as e:
                 print(f"Failed to extract data directly from card: {str(e)}")
                 return None
@@ -137,26 +1035,7 @@ def scrape_project_details(driver, project_element, project_index):
                     print(f"Extracted project ID {project_id} from JavaScript link")
                 
                 try:
-                    rera_no = project_element.find_element(By.CSS_SELECTOR, "span.fw-bold").text.strip()
-                    project_name = project_element.find_element(By.CSS_SELECTOR, "h5.card-title").text.strip()
-                    promoter = project_element.find_element(By.CSS_SELECTOR, "small").text.strip()
-                    if promoter.lower().startswith("by "):
-                        promoter = promoter[3:].strip()
-                    
-                    address = "Not found"
-                    try:
-                        address_element = project_element.find_element(By.XPATH, ".//label[contains(text(), 'Address')]/following-sibling::strong")
-                        address = address_element.text.strip()
-                    except:
-                        pass
-                    
-                    return {
-                        "RERA Regd. No": rera_no,
-                        "Project Name": project_name,
-                        "Promoter Name": promoter,
-                        "Address of the Promoter": address,
-                        "GST No": "Not available without detail page"
-                    }
+                    return card_to_record(parse_card_element(project_element))
                 except Exception as e:
                     print(f"Error extracting data from card: {str(e)}")
                     
@@ -168,130 +1047,45 @@ def scrape_project_details(driver, project_element, project_index):
             else:
                 driver.execute_script("arguments[0].click();", view_button)
             
-            time.sleep(3)
-            
-            new_handles = driver.window_handles
-            if len(new_handles) > len(original_handles):
-                new_window = [h for h in new_handles if h not in original_handles][0]
-                driver.switch_to.window(new_window)
-            
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            with METRICS.span("detail_click"):
+                new_window = wait_for_new_window(driver, original_handles, timeout=5)
+                if new_window:
+                    driver.switch_to.window(new_window)
+                
+                wait_for_page_ready(driver)
             
             handle_popup(driver)
             
         except Exception as e:
             print(f"Error clicking view details button: {str(e)}")
+            if classify_failure(e) in RETRYABLE_FAILURES:
+                raise
             return None
         
-        rera_no = safe_get_element_text(driver, "//th[contains(text(), 'RERA Regd. No')]/following-sibling::td")
-        project_name = safe_get_element_text(driver, "//th[contains(text(), 'Project Name')]/following-sibling::td")
-        
         try:
-           
-            selectors = [
-                "//a[contains(text(), 'Promoter Details')]",
-                "//li/a[contains(text(), 'Promoter')]",
-                "//div[contains(@class, 'tab')]/a[contains(text(), 'Promoter')]"
-            ]
-            
-            found_tab = False
-            for selector in selectors:
-                try:
-                    promoter_tab = WebDriverWait(driver, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
+            with METRICS.span("tab_switch"):
+                promoter_tab = wait_for_any(driver, PROMOTER_TAB_SELECTORS, timeout=5, clickable=True, field="promoter_tab")
+                if promoter_tab is not None:
                     driver.execute_script("arguments[0].click();", promoter_tab)
-                    found_tab = True
                     print("Clicked on Promoter Details tab")
-                    time.sleep(3)
-                    break
-                except (TimeoutException, NoSuchElementException, ElementClickInterceptedException):
-                    continue
-            
-            if not found_tab:
-                print("Could not find or click on Promoter Details tab")
-                return {
-                    "RERA Regd. No": rera_no,
-                    "Project Name": project_name,
-                    "Promoter Name": "Tab not found",
-                    "Address of the Promoter": "Tab not found",
-                    "GST No": "Tab not found"
-                }
-            
-            company_selectors = [
-                "//th[contains(text(), 'Company Name')]/following-sibling::td",
-                "//th[contains(text(), 'Promoter Name')]/following-sibling::td",
-                "//th[contains(text(), 'Name of Promoter')]/following-sibling::td",
-                "//th[contains(text(), 'Company')]/following-sibling::td"
-            ]
-            
-            promoter_name = "Not found"
-            for selector in company_selectors:
-                try:
-                    element = WebDriverWait(driver, 5).until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    promoter_name = element.text.strip()
-                    if promoter_name:
-                        break
-                except (TimeoutException, NoSuchElementException):
-                    continue
-            
-            address_selectors = [
-                "//th[contains(text(), 'Registered Office Address')]/following-sibling::td",
-                "//th[contains(text(), 'Office Address')]/following-sibling::td",
-                "//th[contains(text(), 'Address')]/following-sibling::td"
-            ]
-            
-            address = "Not found"
-            for selector in address_selectors:
-                try:
-                    element = WebDriverWait(driver, 5).until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    address = element.text.strip()
-                    if address:
-                        break
-                except (TimeoutException, NoSuchElementException):
-                    continue
+                    wait_for_tab_pane(driver)
             
-            gst_selectors = [
-                "//th[contains(text(), 'GST No')]/following-sibling::td",
-                "//th[contains(text(), 'GST Number')]/following-sibling::td",
-                "//th[contains(text(), 'GSTIN')]/following-sibling::td"
-            ]
+            record = extract_fields(driver.execute_script("return document.documentElement.outerHTML;"))
             
-            gst_no = "Not found"
-            for selector in gst_selectors:
-                try:
-                    element = WebDriverWait(driver, 5).until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    gst_no = element.text.strip()
-                    if gst_no:
-                        break
-                except (TimeoutException, NoSuchElementException):
-                    continue
+            if promoter_tab is None:
+                print("Could not find or click on Promoter Details tab")
+                for field in ["Promoter Name", "Address of the Promoter", "GST No"]:
+                    record[field] = "Tab not found"
                 
         except Exception as e:
             print(f"Error extracting promoter details: {str(e)}")
-            promoter_name = "Error occurred"
-            address = "Error occurred"
-            gst_no = "Error occurred"
+            record = {field: "Error occurred" for field in RECORD_FIELDS}
+            record["RERA Regd. No"] = "Not found"
+            record["Project Name"] = "Not found"
         
-        if len(driver.window_handles) > 1:
-            driver.close()
-            driver.switch_to.window(original_window)
+        close_other_windows(driver, original_window)
         
-        return {
-            "RERA Regd. No": rera_no,
-            "Project Name": project_name,
-            "Promoter Name": promoter_name,
-            "Address of the Promoter": address,
-            "GST No": gst_no
-        }
+        return record
     
     except Exception as e:
         print(f"Error processing project details: {str(e)}")
@@ -301,89 +1095,1502 @@ def scrape_project_details(driver, project_element, project_index):
                 driver.switch_to.window(driver.window_handles[0])
         except:
             pass
+        if classify_failure(e) in RETRYABLE_FAILURES:
+            raise
         return None
 
-def main():
-    """Main function to scrape the RERA Odisha website."""
-    url = "https://rera.odisha.gov.in/projects/project-list"
-    max_projects = 6
-    min_projects = 6  
-    driver = setup_driver()
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml"
+}
+
+def setup_session(pool_size=20):
+    """Set up and return a pooled HTTP session for the browser-free backend."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(HTTP_HEADERS)
+    return session
+
+class CacheMiss(requests.RequestException):
+    """Raised in offline replay mode when a page is not in the response cache."""
+
+class ResponseCache:
+    """Content-addressed on-disk cache of fetched HTML, keyed by URL and tab.
     
-    try:
-        driver.get(url)
-        print("Loading main page...")
-        time.sleep(5)  
-        
-        handle_popup(driver)
-        
-        project_selectors = [
-            "//div[contains(@class, 'project-card')]",
-            "//div[contains(@class, 'card') and contains(@class, 'project-card')]",
-            "//div[contains(@class, 'container')]/div[contains(@class, 'row')]/div[contains(@class, 'col-lg-4')]",
-            "//div[contains(@class, 'card')]"
-        ]
-        
-        project_identifiers = []
-        for selector in project_selectors:
+    Entries expire after ttl seconds; stale entries carrying an ETag or
+    Last-Modified are revalidated with a conditional request. The total size is
+    capped at max_bytes by evicting least recently used entries. In offline mode
+    every page is served from the cache, stale or not, and misses raise CacheMiss.
+    """
+    
+    def __init__(self, directory, ttl=24 * 3600, max_bytes=500 * 1024 * 1024, offline=False):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(directory, "index.db"), check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                tab TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                etag TEXT,
+                last_modified TEXT
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+        self._conn.commit()
+    
+    @staticmethod
+    def key_for(url, tab=""):
+        return hashlib.sha256(f"{url}\0{tab}".encode("utf-8")).hexdigest()
+    
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".html")
+    
+    def get(self, url, tab=""):
+        """Return (html, is_fresh, etag, last_modified) for a cached page, or None."""
+        key = self.key_for(url, tab)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at, etag, last_modified FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
             try:
-                elements = WebDriverWait(driver, 15).until(
-                    EC.presence_of_all_elements_located((By.XPATH, selector))
-                )
-                for idx, element in enumerate(elements):
-                    try:
-                        project_id = get_project_id_from_element(element)
-                        project_identifiers.append((selector, idx, project_id))
-                    except:
-                        project_identifiers.append((selector, idx, f"project_{idx}"))
-                if project_identifiers:
-                    break
-            except (TimeoutException, NoSuchElementException):
-                continue
-        
-        if not project_identifiers:
-            print("Could not find any projects on the page")
-            driver.save_screenshot("no_projects_found.png")
+                with open(self._path(key), encoding="utf-8") as f:
+                    page_html = f.read()
+            except OSError:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return page_html, time.time() - row[0] < self.ttl, row[1], row[2]
+    
+    def put(self, url, page_html, tab="", etag=None, last_modified=None):
+        """Store a page and evict least recently used entries beyond the size cap."""
+        key = self.key_for(url, tab)
+        path = self._path(key)
+        data = page_html.encode("utf-8")
+        with self._lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            now = time.time()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, tab, len(data), now, now, etag, last_modified)
+            )
+            self._evict()
+            self._conn.commit()
+    
+    def touch(self, url, tab=""):
+        """Mark a revalidated entry as fresh again."""
+        with self._lock:
+            now = time.time()
+            self._conn.execute("UPDATE entries SET stored_at = ?, last_access = ? WHERE key = ?",
+                               (now, now, self.key_for(url, tab)))
+            self._conn.commit()
+    
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
             return
-        
-        print(f"Found {len(project_identifiers)} projects. Starting to extract details...")
-        all_projects_data = []
-        
-        processed_count = 0
-        successful_count = 0
-        
-        while successful_count < min_projects and processed_count < len(project_identifiers):
-            selector, index, project_id = project_identifiers[processed_count]
-            processed_count += 1
-            
-            print(f"\nProcessing project {processed_count} of {len(project_identifiers)} (ID: {project_id})")
-            
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY last_access").fetchall():
+            if total <= self.max_bytes:
+                break
             try:
-                elements = WebDriverWait(driver, 15).until(
+                os.remove(self._path(key))
+            except OSError:
+                pass
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+    
+    def close(self):
+        self._conn.close()
+
+def fetch_html(session, url, timeout=30, cache=None, tab=""):
+    """Fetch a page over HTTP and return its HTML text, going through cache when given."""
+    headers = {}
+    cached = cache.get(url, tab) if cache is not None else None
+    if cache is not None:
+        METRICS.incr("cache", result="hit" if cached is not None else "miss")
+    if cached is not None:
+        page_html, is_fresh, etag, last_modified = cached
+        if is_fresh or cache.offline:
+            return page_html
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    elif cache is not None and cache.offline:
+        raise CacheMiss(f"{url} is not in the response cache (offline mode)")
+    
+    PACER.wait()
+    start = time.monotonic()
+    with METRICS.span("http_fetch"):
+        response = session.get(url, timeout=timeout, headers=headers)
+    PACER.record(time.monotonic() - start)
+    METRICS.incr("http_response", status=response.status_code)
+    if response.status_code == 304 and cached is not None:
+        cache.touch(url, tab)
+        return cached[0]
+    response.raise_for_status()
+    if cache is not None:
+        cache.put(url, response.text, tab, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    return response.text
+
+def card_to_record(card):
+    """Build an output record from the data shown on a project card."""
+    return {
+        "RERA Regd. No": card["rera_no"],
+        "Project Name": card["project_name"],
+        "Promoter Name": card["promoter"],
+        "Address of the Promoter": card["address"],
+        "GST No": "Not available without detail page"
+    }
+
+def needs_javascript(record):
+    """Return True when a statically fetched detail page carried no promoter data."""
+    return all(record[field] == "Not found" for field in ["Promoter Name", "Address of the Promoter", "GST No"])
+
+PLACEHOLDER_VALUES = {"Not available without detail page", "Tab not found", "Error occurred"}
+
+def is_placeholder_record(record):
+    """Return True for a record built without a successful detail page (card-only or failed extraction)."""
+    promoter_fields = ["Promoter Name", "Address of the Promoter", "GST No"]
+    return any(record.get(field) in PLACEHOLDER_VALUES for field in promoter_fields) or needs_javascript(record)
+
+def render_detail_with_selenium(driver, url):
+    """Load a detail page in the browser and return its HTML including the promoter data.
+    
+    The Promoter Details pane is usually in the DOM already, so the tab is only
+    clicked when the first read of the page finds no promoter fields.
+    """
+    paced_get(driver, url)
+    handle_popup(driver)
+    page_html = driver.page_source
+    if not needs_javascript(parse_project_details(page_html)):
+        return page_html
+    with METRICS.span("tab_switch"):
+        promoter_tab = wait_for_any(driver, PROMOTER_TAB_SELECTORS, timeout=5, clickable=True, field="promoter_tab")
+        if promoter_tab is not None:
+            driver.execute_script("arguments[0].click();", promoter_tab)
+            wait_for_tab_pane(driver)
+            page_html = driver.page_source
+    return page_html
+
+def build_detail_url(card, detail_template=None):
+    """Return the detail page URL for a card, from its link or from detail_template."""
+    if card["detail_url"]:
+        return card["detail_url"]
+    if detail_template and not card["project_id"].startswith("project_"):
+        return detail_template.format(project_id=card["project_id"])
+    return None
+
+def fill_from_card(record, card):
+    """Fill fields the detail page did not yield with the values shown on the card."""
+    if record["RERA Regd. No"] == "Not found":
+        record["RERA Regd. No"] = card["rera_no"]
+    if record["Project Name"] == "Not found":
+        record["Project Name"] = card["project_name"]
+    return record
+
+def scrape_project_direct(driver, card, detail_template=None):
+    """Scrape one project by navigating straight to its detail URL in the current tab.
+    
+    No View Details click, window switching or listing refresh is involved.
+    """
+    detail_url = build_detail_url(card, detail_template)
+    if not detail_url:
+        return card_to_record(card)
+    return fill_from_card(parse_project_details(render_detail_with_selenium(driver, detail_url)), card)
+
+def scrape_project_http(session, card, get_driver=None, cache=None, detail_template=None):
+    """Scrape one project over plain HTTP, falling back to Selenium only if the page needs JS."""
+    detail_url = build_detail_url(card, detail_template)
+    if not detail_url:
+        return card_to_record(card)
+    
+    try:
+        record = parse_project_details(retry_call(fetch_html, session, detail_url, cache=cache))
+    except requests.RequestException as e:
+        print(f"HTTP fetch failed for {detail_url} ({classify_failure(e)}): {str(e)}")
+        return card_to_record(card)
+    
+    if needs_javascript(record):
+        cached = cache.get(detail_url, "promoter") if cache is not None else None
+        if cached is not None and (cached[1] or cache.offline):
+            record = parse_project_details(cached[0])
+        elif get_driver is not None and not (cache is not None and cache.offline):
+            print(f"Detail page for {card['project_id']} needs JavaScript, falling back to Selenium")
+            
+            def render():
+                driver = get_driver()
+                try:
+                    return render_detail_with_selenium(driver, detail_url)
+                except Exception as e:
+                    discard_if_crashed(driver, e)
+                    raise
+            
+            try:
+                page_html = retry_call(render)
+                if cache is not None:
+                    cache.put(detail_url, page_html, "promoter")
+                record = parse_project_details(page_html)
+            except Exception as e:
+                print(f"Selenium fallback failed for {card['project_id']}: {str(e)}")
+    
+    if all(record[field] == "Not found" for field in RECORD_FIELDS):
+        METRICS.incr("failure", category="markup_change")
+        print(f"No fields matched on {detail_url}; the page markup may have changed")
+    return fill_from_card(record, card)
+
+class ProjectRecord:
+    """Compact scraped record: five slots instead of a dict, with promoter strings interned.
+    
+    Reads like a mapping keyed on RECORD_FIELDS, so sinks, StateStore and
+    pandas accept it wherever a record dict is expected.
+    """
+    
+    __slots__ = ("rera_no", "project_name", "promoter", "address", "gst_no")
+    
+    SLOTS = dict(zip(RECORD_FIELDS, __slots__))
+    
+    def __init__(self, rera_no=None, project_name=None, promoter=None, address=None, gst_no=None):
+        self.rera_no = rera_no
+        self.project_name = project_name
+        self.promoter = sys.intern(promoter) if isinstance(promoter, str) else promoter
+        self.address = address
+        self.gst_no = gst_no
+    
+    @classmethod
+    def from_mapping(cls, record):
+        if isinstance(record, cls):
+            return record
+        return cls(*(record.get(field) for field in RECORD_FIELDS))
+    
+    def __getitem__(self, field):
+        return getattr(self, self.SLOTS[field])
+    
+    def get(self, field, default=None):
+        return getattr(self, self.SLOTS[field]) if field in self.SLOTS else default
+    
+    def keys(self):
+        return list(RECORD_FIELDS)
+    
+    def __iter__(self):
+        return iter(RECORD_FIELDS)
+    
+    def __len__(self):
+        return len(RECORD_FIELDS)
+    
+    def to_dict(self):
+        return {field: self[field] for field in RECORD_FIELDS}
+    
+    def __repr__(self):
+        return f"ProjectRecord({self.to_dict()!r})"
+
+class RecordSink:
+    """Base class for output sinks that persist each record as soon as it is produced.
+    
+    Records are stored as ProjectRecords. Buffered sinks are flushed early when
+    the memory watchdog reports pressure.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self._pressure_events = MEMORY_WATCHDOG.events
+    
+    def write(self, record):
+        with METRICS.span("output_write"):
+            self._write(ProjectRecord.from_mapping(record))
+        self.count += 1
+        MEMORY_WATCHDOG.check()
+        if MEMORY_WATCHDOG.events != self._pressure_events:
+            self._pressure_events = MEMORY_WATCHDOG.events
+            self.flush()
+    
+    def _write(self, record):
+        raise NotImplementedError
+    
+    def flush(self):
+        pass
+    
+    def close(self):
+        pass
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+class CsvSink(RecordSink):
+    """CSV sink; by default every record hits the file as soon as it is written.
+    
+    flush_every > 1 flushes the file in chunks of that many records instead.
+    """
+    
+    def __init__(self, path, append=False, flush_every=1):
+        super().__init__(path)
+        self.flush_every = flush_every
+        write_header = not (append and os.path.exists(path) and os.path.getsize(path) > 0)
+        self._file = open(path, "a" if append else "w", newline="", encoding="utf-8", buffering=1 if flush_every <= 1 else -1)
+        self._writer = csv.DictWriter(self._file, fieldnames=RECORD_FIELDS, extrasaction="ignore")
+        if write_header:
+            self._writer.writeheader()
+    
+    def _write(self, record):
+        self._writer.writerow(record)
+        if (self.count + 1) % self.flush_every == 0:
+            self.flush()
+    
+    def flush(self):
+        self._file.flush()
+    
+    def close(self):
+        self._file.close()
+
+class JsonlSink(RecordSink):
+    """JSON Lines sink, one object per record, flushed every flush_every records."""
+    
+    def __init__(self, path, append=False, flush_every=1):
+        super().__init__(path)
+        self.flush_every = flush_every
+        self._file = open(path, "a" if append else "w", encoding="utf-8", buffering=1 if flush_every <= 1 else -1)
+    
+    def _write(self, record):
+        self._file.write(json.dumps({field: record.get(field) for field in RECORD_FIELDS}, ensure_ascii=False) + "\n")
+        if (self.count + 1) % self.flush_every == 0:
+            self.flush()
+    
+    def flush(self):
+        self._file.flush()
+    
+    def close(self):
+        self._file.close()
+
+class ParquetSink(RecordSink):
+    """Parquet sink that writes a row group every row_group_size records."""
+    
+    def __init__(self, path, append=False, row_group_size=1000):
+        if pq is None:
+            raise RuntimeError("Parquet output needs pyarrow (pip install pyarrow)")
+        if append:
+            raise RuntimeError("Parquet files cannot be appended to; use .csv, .jsonl or .db output with --state")
+        super().__init__(path)
+        self.row_group_size = row_group_size
+        self._schema = pa.schema([(field, pa.string()) for field in RECORD_FIELDS])
+        self._writer = pq.ParquetWriter(path, self._schema)
+        self._rows = []
+    
+    def _write(self, record):
+        self._rows.append(record)
+        if len(self._rows) >= self.row_group_size:
+            self.flush()
+    
+    def flush(self):
+        if self._rows:
+            columns = {field: [row[field] for row in self._rows] for field in RECORD_FIELDS}
+            self._writer.write_table(pa.Table.from_pydict(columns, schema=self._schema))
+            self._rows = []
+    
+    def close(self):
+        self.flush()
+        self._writer.close()
+
+class SqliteSink(RecordSink):
+    """SQLite sink that commits records in batched transactions."""
+    
+    def __init__(self, path, append=False, batch_size=100, table="projects"):
+        super().__init__(path)
+        self.batch_size = batch_size
+        self.table = table
+        self._conn = sqlite3.connect(path)
+        columns = ", ".join(f'"{field}" TEXT' for field in RECORD_FIELDS)
+        self._conn.execute(f'CREATE TABLE IF NOT EXISTS "{table}" ({columns})')
+        if not append:
+            self._conn.execute(f'DELETE FROM "{table}"')
+        self._conn.commit()
+        self._insert = f'INSERT INTO "{table}" VALUES ({", ".join("?" for _ in RECORD_FIELDS)})'
+        self._rows = []
+    
+    def _write(self, record):
+        self._rows.append(tuple(record.get(field) for field in RECORD_FIELDS))
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+    
+    def flush(self):
+        if self._rows:
+            with self._conn:
+                self._conn.executemany(self._insert, self._rows)
+            self._rows = []
+    
+    def close(self):
+        self.flush()
+        self._conn.close()
+
+SINKS = {
+    ".csv": CsvSink,
+    ".jsonl": JsonlSink,
+    ".parquet": ParquetSink,
+    ".db": SqliteSink,
+    ".sqlite": SqliteSink
+}
+
+SINK_BATCH_OPTIONS = {
+    CsvSink: "flush_every",
+    JsonlSink: "flush_every",
+    ParquetSink: "row_group_size",
+    SqliteSink: "batch_size"
+}
+
+def open_sink(path, append=False, batch_size=None):
+    """Open the output sink matching the file extension of path.
+    
+    batch_size overrides how many records the sink buffers between flushes.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in SINKS:
+        raise ValueError(f"Unsupported output format {extension!r}; use one of {', '.join(SINKS)}")
+    options = {SINK_BATCH_OPTIONS[SINKS[extension]]: batch_size} if batch_size else {}
+    return SINKS[extension](path, append=append, **options)
+
+def read_records(path):
+    """Load a streamed output file back into a DataFrame."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return pd.read_csv(path, dtype=str, keep_default_na=False)
+    if extension == ".jsonl":
+        return pd.read_json(path, lines=True, dtype=False)
+    if extension == ".parquet":
+        return pd.read_parquet(path)
+    with sqlite3.connect(path) as conn:
+        return pd.read_sql_query('SELECT * FROM "projects"', conn)
+
+MISSING_VALUES = ["Not found", "Tab not found", "Not available without detail page", "Error occurred", "N/A", "NA", "-", ""]
+
+RERA_PATTERN = r"^(?P<type>[A-Z]+)/(?P<district>\d{1,2})/(?P<year>\d{4})/(?P<serial>\d+)$"
+GSTIN_PATTERN = r"^\d{2}[A-Z]{5}\d{4}[A-Z][0-9A-Z]Z[0-9A-Z]$"
+GSTIN_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+def gstin_checksum_valid(gstins):
+    """Vectorized GSTIN check-character validation for a Series of well-formed 15-character GSTINs."""
+    if gstins.empty:
+        return pd.Series([], index=gstins.index, dtype=bool)
+    codes = np.frombuffer("".join(gstins).encode("ascii"), dtype=np.uint8).reshape(-1, 15)
+    lookup = np.zeros(256, dtype=np.int64)
+    lookup[np.frombuffer(GSTIN_CHARS.encode("ascii"), dtype=np.uint8)] = np.arange(len(GSTIN_CHARS))
+    values = lookup[codes]
+    products = values[:, :14] * np.tile([1, 2], 7)
+    total = (products // 36 + products % 36).sum(axis=1)
+    return pd.Series((36 - total % 36) % 36 == values[:, 14], index=gstins.index)
+
+def normalize_records(df):
+    """Clean a batch of scraped records with vectorized string operations.
+    
+    Placeholder strings become nulls, whitespace and case are normalised, the
+    RERA number is split into type/district/year/serial, GSTINs are checked
+    against their check character and district/promoter become categoricals.
+    """
+    string_dtype = "string[pyarrow]" if pa is not None else "string"
+    df = df.copy()
+    for field in RECORD_FIELDS:
+        if field not in df:
+            df[field] = pd.NA
+        column = df[field].astype(string_dtype).str.replace(r"\s+", " ", regex=True).str.strip()
+        df[field] = column.mask(column.isin(MISSING_VALUES))
+    
+    df["RERA Regd. No"] = df["RERA Regd. No"].str.replace(r"\s*/\s*", "/", regex=True).str.upper()
+    df["Promoter Name"] = df["Promoter Name"].str.replace(r"^(?i:by)\s+", "", regex=True)
+    df["GST No"] = df["GST No"].str.replace(" ", "", regex=False).str.upper()
+    
+    parts = df["RERA Regd. No"].str.extract(RERA_PATTERN)
+    df["RERA Type"] = parts["type"].astype("category")
+    df["RERA District"] = pd.to_numeric(parts["district"]).astype("Int8").astype("category")
+    df["RERA Year"] = pd.to_numeric(parts["year"]).astype("Int16")
+    df["RERA Serial"] = pd.to_numeric(parts["serial"]).astype("Int32")
+    
+    well_formed = df["GST No"].str.fullmatch(GSTIN_PATTERN).fillna(False).astype(bool)
+    valid = pd.Series(pd.NA, index=df.index, dtype="boolean")
+    valid[df["GST No"].notna()] = False
+    valid[well_formed] = gstin_checksum_valid(df.loc[well_formed, "GST No"].astype(str))
+    df["GST Valid"] = valid
+    
+    df["Promoter Name"] = df["Promoter Name"].astype("category")
+    return df
+
+def build_excel(source_path, excel_path="output.xlsx", normalize=True):
+    """Build the Excel export from a finished streamed output file.
+    
+    Appended runs can hold several versions of a project; only the latest is kept.
+    Records without a RERA number cannot be matched up, so all of them are kept.
+    """
+    try:
+        df = read_records(source_path)
+        if normalize:
+            df = normalize_records(df)
+            missing = df["RERA Regd. No"].isna()
+        else:
+            missing = df["RERA Regd. No"].isna() | df["RERA Regd. No"].str.strip().isin(MISSING_VALUES)
+        df = df[missing | ~df.duplicated(subset="RERA Regd. No", keep="last")]
+        df.to_excel(excel_path, index=False)
+        print(f"Data also saved to {excel_path}")
+    except Exception as e:
+        print(f"Could not save Excel file: {str(e)}")
+
+class StateStore:
+    """Persistent crawl state keyed on RERA registration number.
+    
+    Records when each project was fetched, a hash of its listing card and a hash
+    of the scraped record, so interrupted runs resume and re-crawls only fetch
+    projects that are new or whose listing card changed.
+    """
+    
+    def __init__(self, path, max_age=None):
+        self.path = path
+        self.max_age = max_age
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS projects (
+                key TEXT PRIMARY KEY,
+                card_hash TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                fetched_at TEXT NOT NULL
+            )
+        """)
+        self._conn.commit()
+    
+    @staticmethod
+    def key_for(card):
+        """Return the state key for a card (see stable_project_key)."""
+        return stable_project_key(card)
+    
+    @staticmethod
+    def hash_of(data, fields):
+        """Return a stable content hash of the given fields."""
+        payload = json.dumps([data.get(field) for field in fields], ensure_ascii=False)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+    
+    def needs_fetch(self, card):
+        """Return True if the project is new, its card changed, or its last fetch is too old."""
+        row = self._conn.execute(
+            "SELECT card_hash, fetched_at FROM projects WHERE key = ?", (self.key_for(card),)
+        ).fetchone()
+        if row is None or row[0] != self.hash_of(card, CARD_RULES):
+            return True
+        if self.max_age is not None:
+            fetched_at = datetime.fromisoformat(row[1])
+            return datetime.now(timezone.utc) - fetched_at > self.max_age
+        return False
+    
+    def mark_fetched(self, card, record):
+        """Record a successful fetch of the project behind card.
+        
+        Placeholder records are not recorded, so the project is fetched again on the next run.
+        """
+        if is_placeholder_record(record):
+            METRICS.incr("state_not_marked")
+            return
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO projects (key, card_hash, content_hash, fetched_at) VALUES (?, ?, ?, ?)",
+                (self.key_for(card), self.hash_of(card, CARD_RULES), self.hash_of(record, RECORD_FIELDS),
+                 datetime.now(timezone.utc).isoformat())
+            )
+    
+    def close(self):
+        self._conn.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys for very large seen-sets."""
+    
+    def __init__(self, capacity, error_rate=0.001):
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+    
+    def _positions(self, key):
+        digest = hashlib.sha256(key.encode("utf-8")).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:16], "big") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+    
+    def __contains__(self, key):
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+    
+    def add(self, key):
+        """Add key; return True if it was (probably) not present before."""
+        new = False
+        for p in self._positions(key):
+            if not self.bits[p >> 3] & (1 << (p & 7)):
+                self.bits[p >> 3] |= 1 << (p & 7)
+                new = True
+        return new
+
+class SeenIndex:
+    """Seen-set of project keys that stops the same project being fetched twice in a run.
+    
+    Keys live in a hash set, or in a BloomFilter when bloom_capacity is given
+    (a tiny false-positive rate, constant memory). With a path, the keys of
+    projects whose records were written are also kept on disk (set keys are
+    appended as they are written, the Bloom filter is merged into the file on
+    close, so queue workers sharing it keep each other's keys); with skip_written
+    they are treated as seen, so later runs do not fetch them again.
+    """
+    
+    def __init__(self, path=None, bloom_capacity=None, error_rate=0.001, skip_written=True):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+        self._written = None
+        if bloom_capacity:
+            self._keys = BloomFilter(bloom_capacity, error_rate)
+            if path:
+                self._written = BloomFilter(bloom_capacity, error_rate)
+                if os.path.exists(path):
+                    with open(path, "rb") as f:
+                        header = json.loads(f.readline())
+                        bits = bytearray(f.read())
+                    for bloom in (self._keys, self._written):
+                        bloom.size, bloom.hashes = header["size"], header["hashes"]
+                        bloom.bits = bytearray(bits) if skip_written or bloom is self._written else bytearray(len(bits))
+        else:
+            self._keys = set()
+            if path:
+                if skip_written and os.path.exists(path):
+                    with open(path, encoding="utf-8") as f:
+                        self._keys.update(line.rstrip("\n") for line in f if line.strip())
+                self._file = open(path, "a", encoding="utf-8", buffering=1)
+    
+    def add(self, key):
+        """Note key as handled in this run; return True if it had not been seen before."""
+        with self._lock:
+            if isinstance(self._keys, BloomFilter):
+                return self._keys.add(key)
+            if key in self._keys:
+                return False
+            self._keys.add(key)
+            return True
+    
+    def mark_written(self, key):
+        """Persist key once its record has reached the output."""
+        with self._lock:
+            if self._file is not None:
+                self._file.write(key + "\n")
+            elif self._written is not None:
+                self._written.add(key)
+    
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._keys
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+        elif self._written is not None:
+            bits = self._written.bits
+            if os.path.exists(self.path):
+                with open(self.path, "rb") as f:
+                    header = json.loads(f.readline())
+                    saved = f.read()
+                if (header["size"], header["hashes"]) == (self._written.size, self._written.hashes):
+                    merged = int.from_bytes(bits, "big") | int.from_bytes(saved, "big")
+                    bits = merged.to_bytes(len(bits), "big")
+            with open(self.path, "wb") as f:
+                f.write((json.dumps({"size": self._written.size, "hashes": self._written.hashes}) + "\n").encode("utf-8"))
+                f.write(bits)
+
+def is_duplicate(seen, card):
+    """Return True (and say so) if card's project was already handled in this run."""
+    if seen is None or seen.add(stable_project_key(card)):
+        return False
+    METRICS.incr("duplicate_skipped")
+    print(f"Skipping duplicate project {stable_project_key(card)}")
+    return True
+
+def write_record(sink, record, card=None, state=None, seen=None):
+    """Write record to sink, then note the fetch in the state store and the seen index."""
+    sink.write(record)
+    if card is None:
+        return
+    if state is not None:
+        state.mark_fetched(card, record)
+    if seen is not None and not is_placeholder_record(record):
+        seen.mark_written(stable_project_key(card))
+
+NEXT_PAGE_SELECTORS = [
+    "//a[@rel='next']",
+    "//ul[contains(@class, 'pagination')]//li[contains(@class, 'next')]/a",
+    "//ul[contains(@class, 'pagination')]//a[contains(text(), 'Next') or normalize-space(text())='»' or normalize-space(text())='>']"
+]
+
+def find_next_page_url(page_html, current_url):
+    """Return the URL of the next listing page from the pagination links, or None."""
+    root = lxml_html.fromstring(page_html)
+    for selector in NEXT_PAGE_SELECTORS:
+        for link in _compiled_xpath(selector)(root):
+            href = (link.get("href") or "").strip()
+            parent_class = link.getparent().get("class") or ""
+            if href and not href.startswith("javascript:") and href != "#" and "disabled" not in parent_class:
+                return urljoin(current_url, href)
+    return None
+
+def with_page_param(url, page_param, page):
+    """Return url with its page query parameter set to page."""
+    parts = urlparse(url)
+    query = dict(parse_qsl(parts.query))
+    query[page_param] = str(page)
+    return urlunparse(parts._replace(query=urlencode(query)))
+
+def iter_listing_pages(session, url, page_param=None, max_pages=None, cache=None):
+    """Walk every listing page and yield (page_url, cards) one page at a time.
+    
+    Follows the pagination links; when page_param is given, pages are requested
+    as url?page_param=N instead, which suits a paged listing API.
+    """
+    seen_urls = set()
+    previous_ids = None
+    page = 1
+    page_url = with_page_param(url, page_param, page) if page_param else url
+    while page_url and page_url not in seen_urls:
+        if max_pages is not None and page > max_pages:
+            break
+        seen_urls.add(page_url)
+        page_html = retry_call(fetch_html, session, page_url, cache=cache)
+        cards = parse_project_cards(page_html, page_url)
+        page_ids = [(card["project_id"], card["rera_no"]) for card in cards]
+        if not cards or page_ids == previous_ids:
+            break
+        previous_ids = page_ids
+        yield page_url, cards
+        
+        page += 1
+        if page_param:
+            page_url = with_page_param(url, page_param, page)
+        else:
+            page_url = find_next_page_url(page_html, page_url)
+
+def iter_project_cards(session, url, page_param=None, max_pages=None, cache=None):
+    """Yield project cards from every listing page as a flat stream."""
+    for page_url, cards in iter_listing_pages(session, url, page_param, max_pages, cache):
+        print(f"Listing page {page_url}: {len(cards)} projects")
+        yield from cards
+
+def prefetch(iterable, buffer_size=50):
+    """Run iterable on a background thread, buffering at most buffer_size items ahead.
+    
+    Lets the consumer start on the first items while later ones are still being
+    fetched, without letting the producer run unbounded ahead of it.
+    """
+    buffer = queue.Queue(maxsize=buffer_size)
+    done = object()
+    stop = threading.Event()
+    
+    def produce():
+        try:
+            for item in iterable:
+                while not stop.is_set():
+                    try:
+                        buffer.put(item, timeout=0.5)
+                        break
+                    except queue.Full:
+                        continue
+                if stop.is_set():
+                    return
+        except Exception as e:
+            buffer.put(e)
+        finally:
+            buffer.put(done)
+    
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+def run_http(url, min_projects, sink, selenium_fallback=True, page_param=None, max_pages=None, state=None, cache=None,
+             detail_template=None, seen=None):
+    """Scrape the RERA Odisha website with the browser-free HTTP backend.
+    
+    min_projects=None crawls every listing page; details are scraped while later
+    pages are still being fetched. With a StateStore, unchanged projects are skipped.
+    """
+    session = setup_session()
+    driver = None
+    rendered = False
+    seen = seen if seen is not None else SeenIndex()
+    
+    def get_driver():
+        nonlocal driver, rendered
+        if driver is None or not DRIVER_POOL.owns(driver):
+            driver = DRIVER_POOL.acquire()
+        rendered = True
+        return driver
+    
+    try:
+        print("Loading main page...")
+        cards = prefetch(iter_project_cards(session, url, page_param, max_pages, cache))
+        fetched = 0
+        for index, card in enumerate(cards, start=1):
+            if min_projects is not None and fetched >= min_projects:
+                break
+            if is_duplicate(seen, card):
+                continue
+            if state is not None and not state.needs_fetch(card):
+                print(f"Skipping unchanged project {index} ({StateStore.key_for(card)})")
+                continue
+            print(f"Processing project {index} with ID: {card['project_id']}")
+            fetched += 1
+            rendered = False
+            record = scrape_project_http(session, card, get_driver if selenium_fallback else None, cache, detail_template)
+            if record:
+                write_record(sink, record, card, state, seen)
+            if driver is not None and DRIVER_POOL.track(driver, pages=1 if rendered else 0):
+                print("Recycling browser session")
+                DRIVER_POOL.discard(driver)
+                driver = None
+        cards.close()
+        
+        if not fetched:
+            print("No new or changed projects found on the listing")
+    
+    except Exception as e:
+        print(f"An error occurred: {str(e)}")
+        import traceback
+        traceback.print_exc()
+    
+    finally:
+        session.close()
+        DRIVER_POOL.release(driver)
+
+if aiohttp is not None:
+    FETCH_ERRORS = (requests.RequestException, aiohttp.ClientError, asyncio.TimeoutError)
+else:
+    FETCH_ERRORS = (requests.RequestException, asyncio.TimeoutError)
+
+async def fetch_html_async(client, url, cache=None, tab="", timeout=30):
+    """Async counterpart of fetch_html.
+    
+    client is an aiohttp session, or a requests session run on a thread when
+    aiohttp is not installed.
+    """
+    if aiohttp is None:
+        return await asyncio.to_thread(fetch_html, client, url, timeout, cache, tab)
+    
+    headers = {}
+    cached = cache.get(url, tab) if cache is not None else None
+    if cache is not None:
+        METRICS.incr("cache", result="hit" if cached is not None else "miss")
+    if cached is not None:
+        page_html, is_fresh, etag, last_modified = cached
+        if is_fresh or cache.offline:
+            return page_html
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    elif cache is not None and cache.offline:
+        raise CacheMiss(f"{url} is not in the response cache (offline mode)")
+    
+    await asyncio.sleep(PACER.reserve())
+    start = time.monotonic()
+    async with client.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+        PACER.record(time.monotonic() - start)
+        METRICS.add_time("http_fetch", time.monotonic() - start)
+        METRICS.incr("http_response", status=response.status)
+        if response.status == 304 and cached is not None:
+            cache.touch(url, tab)
+            return cached[0]
+        response.raise_for_status()
+        page_html = await response.text()
+        if cache is not None:
+            cache.put(url, page_html, tab, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    return page_html
+
+def parse_worker_context():
+    """Return the multiprocessing context for the async backend's parse workers.
+    
+    The workers start on the first submit, while the discovery thread may hold
+    METRICS or PACER locks. A forked child would inherit such a lock held and
+    block forever, so the workers come from a fork server (or are spawned).
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+async def _async_pipeline(url, min_projects, sink, state, cache, detail_template, page_param, max_pages,
+                          fetch_concurrency, parse_workers, queue_size, seen):
+    """Run discovery, detail fetch, parse and sink as stages joined by bounded queues.
+    
+    If any stage fails, the other stages are cancelled, discovery is stopped and
+    the error is raised, instead of leaving producers blocked on full queues.
+    """
+    loop = asyncio.get_running_loop()
+    detail_queue = asyncio.Queue(queue_size)
+    parse_queue = asyncio.Queue(queue_size)
+    sink_queue = asyncio.Queue(queue_size)
+    stop_discovery = threading.Event()
+    counts = {"fetched": 0}
+    
+    def discover():
+        listing_session = setup_session()
+        try:
+            for card in iter_project_cards(listing_session, url, page_param, max_pages, cache):
+                if stop_discovery.is_set():
+                    break
+                put = asyncio.run_coroutine_threadsafe(detail_queue.put(card), loop)
+                while True:
+                    try:
+                        put.result(timeout=1)
+                        break
+                    except concurrent.futures.TimeoutError:
+                        if stop_discovery.is_set():
+                            put.cancel()
+                            return
+        except Exception as e:
+            print(f"Listing discovery failed: {str(e)}")
+        finally:
+            listing_session.close()
+    
+    async def fetch_stage(client):
+        while True:
+            card = await detail_queue.get()
+            if card is None:
+                break
+            if min_projects is not None and counts["fetched"] >= min_projects:
+                stop_discovery.set()
+                continue
+            if is_duplicate(seen, card):
+                continue
+            if state is not None and not state.needs_fetch(card):
+                print(f"Skipping unchanged project {StateStore.key_for(card)}")
+                continue
+            counts["fetched"] += 1
+            print(f"Processing project {counts['fetched']} with ID: {card['project_id']}")
+            detail_url = build_detail_url(card, detail_template)
+            page_html = None
+            if detail_url:
+                try:
+                    page_html = await retry_call_async(fetch_html_async, client, detail_url, cache)
+                except FETCH_ERRORS as e:
+                    print(f"HTTP fetch failed for {detail_url} ({classify_failure(e)}): {str(e)}")
+            await parse_queue.put((card, page_html))
+    
+    async def parse_stage(executor):
+        while True:
+            item = await parse_queue.get()
+            if item is None:
+                break
+            card, page_html = item
+            if page_html is None:
+                record = card_to_record(card)
+            else:
+                try:
+                    record = fill_from_card(await loop.run_in_executor(executor, parse_project_details, page_html), card)
+                except Exception as e:
+                    print(f"Could not parse detail page for {card['project_id']}: {str(e)}")
+                    record = card_to_record(card)
+            await sink_queue.put((card, record))
+    
+    async def sink_stage():
+        while True:
+            item = await sink_queue.get()
+            if item is None:
+                break
+            card, record = item
+            write_record(sink, record, card, state, seen)
+    
+    if aiohttp is not None:
+        client = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=fetch_concurrency),
+            headers=HTTP_HEADERS
+        )
+    else:
+        client = setup_session(pool_size=fetch_concurrency)
+    
+    try:
+        with ProcessPoolExecutor(max_workers=parse_workers, mp_context=parse_worker_context()) as executor:
+            sink_task = asyncio.create_task(sink_stage())
+            fetchers = [asyncio.create_task(fetch_stage(client)) for _ in range(fetch_concurrency)]
+            parsers = [asyncio.create_task(parse_stage(executor)) for _ in range(parse_workers)]
+            
+            async def drain():
+                await asyncio.to_thread(discover)
+                for _ in fetchers:
+                    await detail_queue.put(None)
+                await asyncio.gather(*fetchers)
+                for _ in parsers:
+                    await parse_queue.put(None)
+                await asyncio.gather(*parsers)
+                await sink_queue.put(None)
+                await sink_task
+            
+            tasks = [asyncio.create_task(drain()), sink_task, *fetchers, *parsers]
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            failed = [task for task in done if not task.cancelled() and task.exception() is not None]
+            if failed:
+                stop_discovery.set()
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise failed[0].exception()
+    finally:
+        if aiohttp is not None:
+            await client.close()
+        else:
+            client.close()
+    
+    if not counts["fetched"]:
+        print("No new or changed projects found on the listing")
+
+def run_async(url, min_projects, sink, state=None, cache=None, detail_template=None, page_param=None, max_pages=None,
+              fetch_concurrency=8, parse_workers=None, queue_size=100, seen=None):
+    """Scrape with the asyncio pipeline: listing discovery, detail fetch, parse and sink.
+    
+    Each stage has its own concurrency and hands work on through a bounded queue,
+    so network-bound fetches and CPU-bound parsing (in worker processes) overlap
+    while a slow stage pushes back on the ones before it. Pages that need
+    JavaScript are not rendered here; use --backend http for the Selenium fallback.
+    """
+    parse_workers = parse_workers or os.cpu_count() or 1
+    seen = seen if seen is not None else SeenIndex()
+    try:
+        asyncio.run(_async_pipeline(url, min_projects, sink, state, cache, detail_template, page_param, max_pages,
+                                    fetch_concurrency, parse_workers, queue_size, seen))
+    except Exception as e:
+        print(f"An error occurred: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+def discover_project_identifiers(driver):
+    """Return (selector, index, project_id) tuples for the cards on the loaded listing page."""
+    with METRICS.span("card_discovery"):
+        return _discover_project_identifiers(driver)
+
+def _discover_project_identifiers(driver):
+    project_identifiers = []
+    for selector in PROJECT_SELECTORS:
+        try:
+            elements = WebDriverWait(driver, 15).until(
+                EC.presence_of_all_elements_located((By.XPATH, selector))
+            )
+            for idx, element in enumerate(elements):
+                try:
+                    project_id = get_project_id_from_element(element)
+                    project_identifiers.append((selector, idx, project_id))
+                except:
+                    project_identifiers.append((selector, idx, content_project_id(f"{selector}#{idx}")))
+            if project_identifiers:
+                break
+        except (TimeoutException, NoSuchElementException):
+            continue
+    return project_identifiers
+
+def _open_listing(url):
+    """Start a driver and load the project list page on it."""
+    driver = DRIVER_POOL.acquire()
+    try:
+        paced_get(driver, url)
+        handle_popup(driver)
+    except Exception:
+        DRIVER_POOL.discard(driver)
+        raise
+    return driver
+
+WORKER_EXITED = -2
+RETRY_TASK = "retry"
+
+def _pool_worker(worker_id, url, task_queue, result_queue, cards=None, detail_template=None, in_flight=None):
+    """Take projects from the shared queue and scrape them on this worker's own driver.
+    
+    When cards is given the worker navigates straight to each detail page instead
+    of clicking through the listing. Failed projects are handed back to the pool as
+    (RETRY_TASK, task) messages under RETRY_POLICY, so only the pool feeds task_queue.
+    The order and attempt of the task in hand are kept in this worker's two slots
+    of in_flight, so the pool can requeue the task if the worker dies.
+    """
+    slot = 2 * worker_id
+    driver = None
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+        order, selector, index, project_id, attempt = task
+        if in_flight is not None:
+            in_flight[slot], in_flight[slot + 1] = order, attempt
+        record = None
+        RETRY_POLICY.before_attempt(attempt)
+        try:
+            if cards is not None:
+                if driver is None:
+                    driver = DRIVER_POOL.acquire()
+                record = scrape_project_direct(driver, cards[index], detail_template)
+            else:
+                if driver is None:
+                    driver = _open_listing(url)
+                elements = WebDriverWait(driver, 15).until(
+                    EC.presence_of_all_elements_located((By.XPATH, selector))
+                )
+                if len(elements) > index:
+                    record = scrape_project_details(driver, elements[index], order + 1)
+                else:
+                    print(f"[worker {worker_id}] Project index {index} not found in current elements")
+            RETRY_POLICY.on_success()
+        except Exception as e:
+            category = classify_failure(e)
+            print(f"[worker {worker_id}] {category} failure on project {project_id}: {str(e)}")
+            if category == "stale_dom" and cards is None and driver is not None:
+                try:
+                    driver.refresh()
+                    wait_for_page_ready(driver)
+                    handle_popup(driver)
+                except WebDriverException:
+                    driver = _recycle_driver(driver)
+            elif category == "driver_crash" and driver is not None:
+                driver = _recycle_driver(driver)
+            delay = RETRY_POLICY.on_failure(e, attempt)
+            if delay is not None:
+                time.sleep(delay)
+                result_queue.put((RETRY_TASK, (order, selector, index, project_id, attempt + 1)))
+                if in_flight is not None:
+                    in_flight[slot] = -1
+                continue
+        result_queue.put((order, record))
+        if in_flight is not None:
+            in_flight[slot] = -1
+        if driver is not None and DRIVER_POOL.track(driver):
+            driver = _recycle_driver(driver)
+        PACER.wait()
+    
+    DRIVER_POOL.release(driver)
+    result_queue.put((None, worker_id))
+    if in_flight is not None:
+        in_flight[slot] = WORKER_EXITED
+
+def _recycle_driver(driver):
+    """Quit a (possibly crashed) driver and return None so the worker starts a fresh one."""
+    DRIVER_POOL.discard(driver)
+    return None
+
+def run_selenium_pool(url, min_projects, sink, workers=4, pool_kind="thread", state=None, direct=False, detail_template=None,
+                      seen=None):
+    """Scrape project details with a pool of WebDrivers fed from a shared queue.
+    
+    Process workers are forked, so they share the pacer and retry state set up
+    here. A worker that dies is replaced and its in-flight project requeued; their
+    results go through a SimpleQueue, which writes straight to the pipe, so nothing
+    a worker sent before dying is lost in a feeder thread.
+    """
+    if pool_kind == "process" and "fork" not in multiprocessing.get_all_start_methods():
+        print("Process workers need the fork start method, which this platform lacks; using threads instead")
+        pool_kind = "thread"
+    
+    driver = _open_listing(url)
+    try:
+        project_identifiers = discover_project_identifiers(driver)
+        cards = []
+        if project_identifiers:
+            elements = driver.find_elements(By.XPATH, project_identifiers[0][0])
+            cards = [parse_card_element(element) for element in elements]
+    finally:
+        if pool_kind == "process":
+            DRIVER_POOL.discard(driver)
+        else:
+            DRIVER_POOL.release(driver)
+    
+    if not project_identifiers:
+        print("Could not find any projects on the page")
+        return
+    
+    seen = seen if seen is not None else SeenIndex()
+    project_identifiers = [identifier for identifier in project_identifiers
+                           if identifier[1] >= len(cards) or not is_duplicate(seen, cards[identifier[1]])]
+    if state is not None:
+        project_identifiers = [identifier for identifier in project_identifiers
+                               if identifier[1] >= len(cards) or state.needs_fetch(cards[identifier[1]])]
+        if not project_identifiers:
+            print("No new or changed projects found on the listing")
+            return
+    
+    project_identifiers = project_identifiers[:min_projects]
+    workers = max(1, min(workers, len(project_identifiers)))
+    print(f"Found {len(project_identifiers)} projects. Scraping with {workers} {pool_kind} workers...")
+    
+    if pool_kind == "process":
+        context = multiprocessing.get_context("fork")
+        task_queue, result_queue = context.Queue(), context.SimpleQueue()
+        in_flight = context.Array("i", [-1] * (2 * workers), lock=False)
+        worker_class = context.Process
+        share_state(PACER)
+        RETRY_POLICY.share()
+    else:
+        task_queue, result_queue = queue.Queue(), queue.Queue()
+        in_flight = [-1] * (2 * workers)
+        worker_class = threading.Thread
+    
+    for order, (selector, index, project_id) in enumerate(project_identifiers):
+        task_queue.put((order, selector, index, project_id, 0))
+    
+    if pool_kind == "thread":
+        DRIVER_POOL.warm(workers)
+    worker_cards = cards if direct else None
+    
+    def start_worker(n):
+        in_flight[2 * n] = -1
+        worker = worker_class(target=_pool_worker, daemon=True,
+                              args=(n, url, task_queue, result_queue, worker_cards, detail_template, in_flight))
+        worker.start()
+        return worker
+    
+    pool = [start_worker(n) for n in range(workers)]
+    
+    def emit(order, record):
+        if record:
+            index = project_identifiers[order][1]
+            write_record(sink, record, cards[index] if index < len(cards) else None, state, seen)
+    
+    pending = {}
+    received = set()
+    next_order = 0
+    
+    def accept(order, record):
+        nonlocal next_order
+        if order in received:
+            return
+        received.add(order)
+        pending[order] = ProjectRecord.from_mapping(record) if record else record
+        while next_order in pending:
+            emit(next_order, pending.pop(next_order))
+            next_order += 1
+    
+    def next_message():
+        if pool_kind == "thread":
+            try:
+                return result_queue.get(timeout=1)
+            except queue.Empty:
+                return None
+        deadline = time.monotonic() + 1
+        while result_queue.empty():
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(0.01)
+        return result_queue.get()
+    
+    def recover_crashed_workers():
+        for n, worker in enumerate(pool):
+            if n in finished or worker.is_alive() or in_flight[2 * n] == WORKER_EXITED:
+                continue
+            order, attempt = in_flight[2 * n], in_flight[2 * n + 1]
+            METRICS.incr("worker_crash")
+            if order < 0 or order in received:
+                print(f"Worker {n} died; starting a replacement")
+            elif attempt + 1 < RETRY_POLICY.max_attempts:
+                print(f"Worker {n} died; requeueing project {project_identifiers[order][2]} and starting a replacement")
+                task_queue.put((order, *project_identifiers[order], attempt + 1))
+            else:
+                print(f"Worker {n} died on project {project_identifiers[order][2]} again; giving up on it")
+                accept(order, None)
+            pool[n] = start_worker(n)
+            if stopping:
+                task_queue.put(None)
+    
+    finished = set()
+    stopping = False
+    while len(finished) < workers:
+        message = next_message()
+        if message is not None:
+            key, value = message
+            if key is None:
+                finished.add(value)
+            elif key == RETRY_TASK:
+                task_queue.put(value)
+            else:
+                accept(key, value)
+        recover_crashed_workers()
+        if next_order == len(project_identifiers) and not stopping:
+            stopping = True
+            for _ in pool:
+                task_queue.put(None)
+    
+    for order in sorted(pending):
+        emit(order, pending[order])
+    for worker in pool:
+        worker.join()
+
+def run_selenium_direct(url, min_projects, sink, state=None, detail_template=None, seen=None):
+    """Scrape with one browser, loading each detail page directly in a dedicated tab.
+    
+    The listing is read once from its page source and its tab is left untouched,
+    so there are no stale card elements and no refresh-and-retry cycles.
+    """
+    driver = DRIVER_POOL.acquire()
+    seen = seen if seen is not None else SeenIndex()
+    
+    try:
+        print("Loading main page...")
+        paced_get(driver, url)
+        handle_popup(driver)
+        cards = parse_project_cards(driver.page_source, url)
+        if not cards:
+            print("Could not find any projects on the page")
+            driver.save_screenshot("no_projects_found.png")
+            return
+        
+        print(f"Found {len(cards)} projects. Starting to extract details...")
+        listing_window = driver.current_window_handle
+        driver.switch_to.new_window("tab")
+        
+        def scrape(card):
+            nonlocal driver, listing_window
+            try:
+                return scrape_project_direct(driver, card, detail_template)
+            except Exception as e:
+                if discard_if_crashed(driver, e):
+                    driver = DRIVER_POOL.acquire()
+                    listing_window = None
+                raise
+        
+        fetched = 0
+        for index, card in enumerate(cards, start=1):
+            if fetched >= min_projects:
+                break
+            if is_duplicate(seen, card):
+                continue
+            if state is not None and not state.needs_fetch(card):
+                print(f"Skipping unchanged project {index} ({StateStore.key_for(card)})")
+                continue
+            print(f"\nProcessing project {index} of {len(cards)} (ID: {card['project_id']})")
+            fetched += 1
+            try:
+                record = retry_call(scrape, card)
+            except Exception as e:
+                print(f"Error processing project {index} ({classify_failure(e)}): {str(e)}")
+                continue
+            write_record(sink, record, card, state, seen)
+            
+            if DRIVER_POOL.track(driver):
+                print("Recycling browser session")
+                DRIVER_POOL.discard(driver)
+                driver = DRIVER_POOL.acquire()
+                listing_window = None
+        
+        if listing_window is not None:
+            driver.close()
+            driver.switch_to.window(listing_window)
+    
+    except Exception as e:
+        print(f"An error occurred: {str(e)}")
+        import traceback
+        traceback.print_exc()
+    
+    finally:
+        DRIVER_POOL.release(driver)
+
+def run_selenium(url, min_projects, sink, state=None, seen=None):
+    """Scrape the RERA Odisha website with a headless Chrome session."""
+    driver = DRIVER_POOL.acquire()
+    seen = seen if seen is not None else SeenIndex()
+    
+    try:
+        print("Loading main page...")
+        paced_get(driver, url)
+        
+        handle_popup(driver)
+        
+        project_selectors = PROJECT_SELECTORS
+        
+        project_identifiers = discover_project_identifiers(driver)
+        
+        if not project_identifiers:
+            print("Could not find any projects on the page")
+            driver.save_screenshot("no_projects_found.png")
+            return
+        
+        print(f"Found {len(project_identifiers)} projects. Starting to extract details...")
+        processed_count = 0
+        successful_count = 0
+        attempt = 0
+        
+        while successful_count < min_projects and processed_count < len(project_identifiers):
+            selector, index, project_id = project_identifiers[processed_count]
+            processed_count += 1
+            
+            print(f"\nProcessing project {processed_count} of {len(project_identifiers)} (ID: {project_id})")
+            
+            RETRY_POLICY.before_attempt(attempt)
+            try:
+                elements = WebDriverWait(driver, 15).until(
                     EC.presence_of_all_elements_located((By.XPATH, selector))
                 )
                 if len(elements) > index:
                     project_element = elements[index]
+                    card = parse_card_element(project_element)
+                    if attempt == 0 and is_duplicate(seen, card):
+                        continue
+                    if state is not None and not state.needs_fetch(card):
+                        print(f"Skipping unchanged project {StateStore.key_for(card)}")
+                        attempt = 0
+                        continue
                     project_data = scrape_project_details(driver, project_element, processed_count)
+                    RETRY_POLICY.on_success()
                     if project_data:
-                        all_projects_data.append(project_data)
+                        write_record(sink, project_data, card, state, seen)
                         successful_count += 1
                         print(f"Successfully scraped project {successful_count} of {min_projects}")
                     else:
                         print(f"Project {processed_count} scraping failed, moving to next")
                 else:
                     print(f"Project index {index} not found in current elements")
-            except StaleElementReferenceException:
-                print("Stale element reference, retrying...")
-                time.sleep(2)
-                driver.refresh()
-                time.sleep(3)
-                handle_popup(driver)
-                continue
             except Exception as e:
-                print(f"Error processing project {processed_count}: {str(e)}")
+                category = classify_failure(e)
+                print(f"Error processing project {processed_count} ({category}): {str(e)}")
+                delay = RETRY_POLICY.on_failure(e, attempt)
+                if category in ("stale_dom", "driver_crash"):
+                    try:
+                        driver.refresh()
+                        wait_for_page_ready(driver)
+                        handle_popup(driver)
+                    except WebDriverException:
+                        DRIVER_POOL.discard(driver)
+                        driver = _open_listing(url)
+                if delay is not None:
+                    print(f"Retrying project {processed_count} in {delay:.1f}s")
+                    time.sleep(delay)
+                    processed_count -= 1
+                    attempt += 1
+                    continue
             
-            time.sleep(2)
+            attempt = 0
+            if DRIVER_POOL.track(driver):
+                print("Recycling browser session")
+                DRIVER_POOL.discard(driver)
+                driver = _open_listing(url)
+            PACER.wait()
             
             if successful_count >= min_projects:
                 break
@@ -403,7 +2610,7 @@ def main():
                                     project_id = get_project_id_from_element(element)
                                     new_project_identifiers.append((selector, idx, project_id))
                                 except:
-                                    new_project_identifiers.append((selector, idx, f"project_{idx}"))
+                                    new_project_identifiers.append((selector, idx, content_project_id(f"{selector}#{idx}")))
                     except:
                         continue
                 
@@ -419,9 +2626,14 @@ def main():
                         )
                         if len(elements) > index:
                             project_element = elements[index]
-                            project_data = scrape_project_details(driver, project_element, processed_count+1)
+                            card = parse_card_element(project_element)
+                            if is_duplicate(seen, card):
+                                continue
+                            if state is not None and not state.needs_fetch(card):
+                                continue
+                            project_data = retry_call(scrape_project_details, driver, project_element, processed_count+1)
                             if project_data:
-                                all_projects_data.append(project_data)
+                                write_record(sink, project_data, card, state, seen)
                                 successful_count += 1
                                 print(f"Successfully scraped additional project {successful_count} of {min_projects}")
                             else:
@@ -429,22 +2641,10 @@ def main():
                     except Exception as e:
                         print(f"Error processing additional project: {str(e)}")
                     
-                    time.sleep(2)
+                    PACER.wait()
             except Exception as e:
                 print(f"Error finding additional projects: {str(e)}")
         
-        if all_projects_data:
-            df = pd.DataFrame(all_projects_data)
-            df.to_csv("output.csv", index=False)
-            print(f"Successfully scraped {len(all_projects_data)} projects. Data saved to output.csv")
-            
-            try:
-                df.to_excel("output.xlsx", index=False)
-                print("Data also saved to output.xlsx")
-            except Exception as e:
-                print(f"Could not save Excel file: {str(e)}")
-        else:
-            print("No project data was collected")
                 
     except Exception as e:
         print(f"An error occurred: {str(e)}")
@@ -452,7 +2652,450 @@ def main():
         traceback.print_exc()
     
     finally:
-        driver.quit()
+        DRIVER_POOL.release(driver)
+
+class WorkQueue:
+    """Shared SQLite work queue of listing shards, claimed by workers under time-limited leases.
+    
+    A task whose lease runs out (its worker died or hung) goes back to pending and
+    is handed to the next worker that asks. Completed project keys are recorded
+    too, so a re-run task skips the projects that already reached the sink.
+    
+    The queue file must be on a local disk: SQLite's locking (and WAL mode in
+    particular) is not reliable on network filesystems, so every worker runs
+    on the machine that holds the queue.
+    """
+    
+    def __init__(self, path, lease_seconds=300, max_attempts=3):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._conn = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                id TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                owner TEXT,
+                lease_until REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT
+            );
+            CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, lease_until);
+            CREATE TABLE IF NOT EXISTS done_keys (key TEXT PRIMARY KEY);
+            CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+        """)
+    
+    @contextmanager
+    def _transaction(self):
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+    
+    def enqueue(self, task_id, cards):
+        """Add a shard of cards and return True, or False if a task with that ID is still queued."""
+        with self._transaction() as conn:
+            return conn.execute("INSERT OR IGNORE INTO tasks (id, payload) VALUES (?, ?)",
+                                (task_id, json.dumps(cards))).rowcount == 1
+    
+    def seal(self):
+        """Mark the queue complete so idle workers exit once it drains."""
+        with self._transaction() as conn:
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('sealed', '1')")
+    
+    def start_run(self):
+        """Prepare the queue for a new coordinator run; return True when resuming an unfinished one.
+        
+        Finished and failed tasks of earlier runs are dropped so their shards can be
+        queued again. The completed-project keys are only kept while tasks of an
+        interrupted run are still pending, so resumed tasks skip what was written.
+        """
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM meta WHERE name = 'sealed'")
+            conn.execute("DELETE FROM tasks WHERE status IN ('done', 'failed')")
+            resuming = conn.execute("SELECT 1 FROM tasks LIMIT 1").fetchone() is not None
+            if not resuming:
+                conn.execute("DELETE FROM done_keys")
+        return resuming
+    
+    def claim(self, worker_id):
+        """Lease the next pending task to worker_id and return (task_id, cards), or None."""
+        now = time.time()
+        with self._transaction() as conn:
+            expired = conn.execute("UPDATE tasks SET status = 'pending', owner = NULL "
+                                   "WHERE status = 'leased' AND lease_until < ?", (now,)).rowcount
+            if expired:
+                METRICS.incr("lease_expired", expired)
+            row = conn.execute("SELECT id, payload FROM tasks WHERE status = 'pending' ORDER BY rowid LIMIT 1").fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE tasks SET status = 'leased', owner = ?, lease_until = ?, attempts = attempts + 1 "
+                         "WHERE id = ?", (worker_id, now + self.lease_seconds, row[0]))
+        return row[0], json.loads(row[1])
+    
+    def renew(self, task_id, worker_id):
+        """Extend worker_id's lease on task_id; return False if the lease was lost."""
+        with self._transaction() as conn:
+            return conn.execute("UPDATE tasks SET lease_until = ? WHERE id = ? AND owner = ? AND status = 'leased'",
+                                (time.time() + self.lease_seconds, task_id, worker_id)).rowcount == 1
+    
+    def complete(self, task_id, worker_id):
+        with self._transaction() as conn:
+            conn.execute("UPDATE tasks SET status = 'done', lease_until = NULL WHERE id = ? AND owner = ?",
+                         (task_id, worker_id))
+    
+    def fail(self, task_id, worker_id, error):
+        """Return a task to the queue, or park it as failed after max_attempts claims."""
+        with self._transaction() as conn:
+            conn.execute("UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                         "owner = NULL, lease_until = NULL, error = ? WHERE id = ? AND owner = ?",
+                         (self.max_attempts, error, task_id, worker_id))
+    
+    def mark_done(self, key):
+        self._conn.execute("INSERT OR IGNORE INTO done_keys VALUES (?)", (key,))
+    
+    def is_done(self, key):
+        return self._conn.execute("SELECT 1 FROM done_keys WHERE key = ?", (key,)).fetchone() is not None
+    
+    def counts(self):
+        """Return the number of tasks in each status."""
+        return dict(self._conn.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall())
+    
+    def drained(self):
+        """Return True once the queue is sealed and no task is pending or leased."""
+        if self._conn.execute("SELECT 1 FROM meta WHERE name = 'sealed'").fetchone() is None:
+            return False
+        return self._conn.execute("SELECT 1 FROM tasks WHERE status IN ('pending', 'leased') LIMIT 1").fetchone() is None
+    
+    def close(self):
+        self._conn.close()
+
+def rera_district(card):
+    """Return the district code segment of a card's RERA number (RP/01/2025/01362 -> 01), or None."""
+    match = re.match(r"^[A-Z]+/(\d{1,2})/", re.sub(r"\s+", "", card.get("rera_no") or "").upper())
+    return match.group(1).zfill(2) if match else None
+
+def run_coordinator(url, work_queue, shard="page", page_param=None, max_pages=None, state=None, cache=None, seen=None,
+                    shard_size=50):
+    """Crawl the listing and split the projects into shards on the work queue.
+    
+    shard="page" queues one task per listing page; shard="district" groups the
+    projects by the district code in their RERA number, in tasks of up to
+    shard_size projects. Only listing pages are fetched here; workers fetch details.
+    """
+    session = setup_session()
+    seen = seen if seen is not None else SeenIndex()
+    districts = {}
+    queued = 0
+    
+    def enqueue(task_id, cards):
+        nonlocal queued
+        if work_queue.enqueue(task_id, cards):
+            queued += len(cards)
+    
+    def flush(district):
+        cards = districts.pop(district)
+        enqueue(f"district:{district}:{stable_project_key(cards[0])}", cards)
+    
+    try:
+        for page_url, cards in iter_listing_pages(session, url, page_param, max_pages, cache):
+            cards = [card for card in cards if not is_duplicate(seen, card)]
+            if state is not None:
+                cards = [card for card in cards if state.needs_fetch(card)]
+            print(f"Listing page {page_url}: {len(cards)} projects to fetch")
+            if shard == "page":
+                if cards:
+                    enqueue(f"page:{page_url}", cards)
+                continue
+            for card in cards:
+                district = rera_district(card) or "unknown"
+                districts.setdefault(district, []).append(card)
+                if len(districts[district]) >= shard_size:
+                    flush(district)
+        for district in list(districts):
+            flush(district)
+    finally:
+        work_queue.seal()
+        session.close()
+    print(f"Queued {queued} projects: {work_queue.counts()}")
+
+def queue_worker(worker_id, queue_path, output, backend="http", selenium_fallback=True, detail_template=None,
+                 state_path=None, cache_options=None, seen_options=None, lease_seconds=300, poll_interval=2.0,
+                 sink_factory=open_sink):
+    """Claim shards from the work queue and append their records to the shared output until it drains.
+    
+    Runs the same per-project extraction as the single-host backends: plain HTTP
+    (with the Selenium fallback) or, for backend="selenium", direct navigation in Chrome.
+    sink_factory(output, append=True) opens the output; it defaults to open_sink.
+    seen_options opens a SeenIndex that records the keys of written projects.
+    """
+    work_queue = WorkQueue(queue_path, lease_seconds)
+    state = StateStore(state_path) if state_path else None
+    cache = ResponseCache(**cache_options) if cache_options else None
+    seen = SeenIndex(**seen_options) if seen_options else None
+    session = setup_session()
+    driver = None
+    rendered = False
+    
+    def get_driver():
+        nonlocal driver, rendered
+        if driver is None or not DRIVER_POOL.owns(driver):
+            driver = DRIVER_POOL.acquire()
+        rendered = True
+        return driver
+    
+    try:
+        with sink_factory(output, append=True) as sink:
+            while True:
+                task = work_queue.claim(worker_id)
+                if task is None:
+                    if work_queue.drained():
+                        break
+                    time.sleep(poll_interval)
+                    continue
+                task_id, cards = task
+                print(f"[{worker_id}] Claimed {task_id} ({len(cards)} projects)")
+                try:
+                    for card in cards:
+                        key = stable_project_key(card)
+                        if work_queue.is_done(key):
+                            continue
+                        rendered = False
+                        if backend == "selenium":
+                            record = scrape_project_direct(get_driver(), card, detail_template)
+                        else:
+                            record = scrape_project_http(session, card, get_driver if selenium_fallback else None,
+                                                         cache, detail_template)
+                        if record:
+                            write_record(sink, record, card, state, seen)
+                            sink.flush()
+                        work_queue.mark_done(key)
+                        if not work_queue.renew(task_id, worker_id):
+                            raise RuntimeError("lease expired and the task was handed to another worker")
+                        if driver is not None and DRIVER_POOL.track(driver, pages=1 if rendered else 0):
+                            DRIVER_POOL.discard(driver)
+                            driver = None
+                        PACER.wait()
+                except Exception as e:
+                    print(f"[{worker_id}] {task_id} failed ({classify_failure(e)}): {str(e)}")
+                    if discard_if_crashed(driver, e):
+                        driver = None
+                    work_queue.fail(task_id, worker_id, str(e))
+                    continue
+                work_queue.complete(task_id, worker_id)
+                METRICS.incr("tasks_completed")
+        print(f"[{worker_id}] Queue drained; wrote {sink.count} records")
+        return sink.count
+    finally:
+        session.close()
+        DRIVER_POOL.release(driver)
+        DRIVER_POOL.close()
+        if state is not None:
+            state.close()
+        if seen is not None:
+            seen.close()
+        if cache is not None:
+            cache.close()
+        work_queue.close()
+
+def run_distributed(url, queue_path, output, role="both", workers=4, shard="page", page_param=None, max_pages=None,
+                    state=None, cache=None, seen=None, lease_seconds=300, worker_id=None, append=False,
+                    sink_factory=open_sink, **worker_options):
+    """Run this process's part of a crawl over a shared work queue.
+    
+    role="coordinator" only fills the queue, role="worker" only drains it, and
+    role="both" starts `workers` worker processes and feeds them. Separately
+    started workers join by pointing at the same queue and output files; start
+    them after the coordinator, since a worker exits once it finds the queue drained.
+    The coordinator truncates output unless append is set or it resumes an
+    interrupted run. sink_factory opens output (see queue_worker).
+    """
+    worker_id = worker_id or f"{platform.node()}-{os.getpid()}"
+    worker_options = dict(worker_options, lease_seconds=lease_seconds, sink_factory=sink_factory)
+    if role == "worker":
+        return queue_worker(worker_id, queue_path, output, **worker_options)
+    
+    work_queue = WorkQueue(queue_path, lease_seconds)
+    if work_queue.start_run():
+        print(f"Resuming unfinished work queue: {work_queue.counts()}")
+        append = True
+    sink_factory(output, append=append).close()
+    pool = []
+    if role == "both":
+        share_state(PACER)
+        RETRY_POLICY.share()
+        pool = [multiprocessing.Process(target=queue_worker,
+                                        args=(f"{worker_id}-{n}", queue_path, output),
+                                        kwargs=worker_options)
+                for n in range(workers)]
+        for worker in pool:
+            worker.start()
+    try:
+        run_coordinator(url, work_queue, shard, page_param, max_pages, state, cache, seen)
+        for worker in pool:
+            worker.join()
+        print(f"Work queue: {work_queue.counts()}")
+    finally:
+        for worker in pool:
+            if worker.is_alive():
+                worker.terminate()
+        work_queue.close()
+
+def main():
+    """Main function to scrape the RERA Odisha website."""
+    parser = argparse.ArgumentParser(description="Scrape project details from the RERA Odisha website.")
+    parser.add_argument("--backend", choices=["selenium", "http", "async"], default="selenium",
+                        help="fetch pages with headless Chrome, plain pooled HTTP, or the asyncio HTTP pipeline")
+    parser.add_argument("--url", default=BASE_URL, help="project list URL (point at a local fixture server for testing)")
+    parser.add_argument("--max-projects", type=int, default=6, help="number of projects to scrape")
+    parser.add_argument("--all", action="store_true",
+                        help="with --backend http or async, crawl every listing page instead of stopping at --max-projects")
+    parser.add_argument("--page-param", help="query parameter used to page the listing (e.g. page) when it has no next links")
+    parser.add_argument("--max-pages", type=int, help="stop the listing crawl after this many pages")
+    parser.add_argument("--no-selenium-fallback", action="store_true",
+                        help="with --backend http, never start Chrome for pages that need JavaScript")
+    parser.add_argument("--min-interval", type=float, default=PACER.min_interval,
+                        help="minimum seconds between requests; the pacer widens this as server latency grows")
+    parser.add_argument("--workers", type=int, default=1, help="number of concurrent WebDrivers for detail pages")
+    parser.add_argument("--pool", choices=["thread", "process"], default="thread",
+                        help="run the WebDriver workers as threads or as separate (forked) processes")
+    parser.add_argument("--output", default="output.csv",
+                        help="file each record is appended to as it is scraped (.csv, .jsonl, .parquet, .db/.sqlite)")
+    parser.add_argument("--excel", default="output.xlsx",
+                        help="Excel file built from the output at the end of the run (empty string to skip)")
+    parser.add_argument("--raw-excel", action="store_true",
+                        help="export records to Excel as scraped, without the normalization stage")
+    parser.add_argument("--state",
+                        help="SQLite crawl-state file; resumes interrupted runs, skips unchanged projects and appends to --output")
+    parser.add_argument("--max-age", type=float,
+                        help="with --state, re-fetch projects whose last fetch is older than this many hours")
+    parser.add_argument("--cache-dir", help="on-disk cache of fetched listing and detail HTML")
+    parser.add_argument("--cache-ttl", type=float, default=24, help="hours before a cached page is revalidated")
+    parser.add_argument("--cache-size", type=float, default=500, help="cache size cap in MB (least recently used pages are evicted)")
+    parser.add_argument("--offline", action="store_true", help="replay the whole run from --cache-dir without touching the network")
+    parser.add_argument("--recycle-after", type=int, default=DRIVER_POOL.max_pages,
+                        help="restart a browser session after it has served this many projects")
+    parser.add_argument("--load-resources", action="store_true",
+                        help="let Chrome load images, fonts and analytics scripts (blocked by default)")
+    parser.add_argument("--direct", action="store_true",
+                        help="open each detail page by URL in its own tab instead of clicking View Details")
+    parser.add_argument("--detail-url-template", default=DETAIL_URL_TEMPLATE,
+                        help="detail page URL built from the project ID when a card has no usable link")
+    parser.add_argument("--fetch-concurrency", type=int, default=8, help="with --backend async, detail fetches in flight")
+    parser.add_argument("--parse-workers", type=int, help="with --backend async, parser processes (default: CPU count)")
+    parser.add_argument("--queue-size", type=int, default=100, help="with --backend async, capacity of each stage queue")
+    parser.add_argument("--metrics-json", help="write the per-stage timings and counters to this JSON file")
+    parser.add_argument("--metrics-prom", help="write the per-stage timings and counters in Prometheus text format")
+    parser.add_argument("--max-attempts", type=int, default=RETRY_POLICY.max_attempts,
+                        help="attempts per project for retryable failures (timeouts, stale DOM, 5xx, driver crashes)")
+    parser.add_argument("--retry-budget", type=float, default=RETRY_POLICY.budget.ratio,
+                        help="retries allowed across the run as a fraction of projects attempted")
+    parser.add_argument("--breaker-threshold", type=int, default=RETRY_POLICY.breaker.failure_threshold,
+                        help="consecutive site failures that pause the crawl")
+    parser.add_argument("--breaker-cooldown", type=float, default=RETRY_POLICY.breaker.cooldown,
+                        help="seconds the crawl pauses once the circuit breaker opens")
+    parser.add_argument("--seen-index",
+                        help="file of project keys whose records were written; without --state, later runs skip them")
+    parser.add_argument("--bloom", type=int,
+                        help="use a Bloom filter sized for this many projects instead of an exact set (huge runs)")
+    parser.add_argument("--queue", help="SQLite work queue (on a local disk) shared by the worker processes of a crawl")
+    parser.add_argument("--role", choices=["both", "coordinator", "worker"], default="both",
+                        help="with --queue: fill the queue, drain it, or both (--workers local worker processes)")
+    parser.add_argument("--shard", choices=["page", "district"], default="page",
+                        help="with --queue, split the listing into tasks per listing page or per RERA district code")
+    parser.add_argument("--lease", type=float, default=300,
+                        help="with --queue, seconds a claimed task stays leased before it is handed to another worker")
+    parser.add_argument("--worker-id", help="with --queue, name of this node in the queue (default: hostname-pid)")
+    parser.add_argument("--memory-limit", type=float,
+                        help="MB of RSS (this process plus its browsers) above which browsers are recycled and output flushed")
+    parser.add_argument("--batch-size", type=int,
+                        help="records buffered by the output sink between flushes (default: per format)")
+    args = parser.parse_args()
+    PACER.min_interval = args.min_interval
+    RETRY_POLICY.max_attempts = args.max_attempts
+    RETRY_POLICY.budget.ratio = args.retry_budget
+    RETRY_POLICY.breaker.failure_threshold = args.breaker_threshold
+    RETRY_POLICY.breaker.cooldown = args.breaker_cooldown
+    DRIVER_POOL.max_pages = args.recycle_after
+    DRIVER_POOL.block_resources = not args.load_resources
+    MEMORY_WATCHDOG.limit_mb = args.memory_limit
+    
+    if args.offline and not args.cache_dir:
+        parser.error("--offline needs --cache-dir")
+    if args.cache_dir and args.backend == "selenium":
+        parser.error("--cache-dir and --offline work with --backend http or async")
+    if args.queue and args.backend == "async":
+        parser.error("--queue workers use --backend http or selenium")
+    
+    max_age = timedelta(hours=args.max_age) if args.max_age is not None else None
+    state = StateStore(args.state, max_age) if args.state else None
+    seen = SeenIndex(args.seen_index, bloom_capacity=args.bloom, skip_written=state is None)
+    cache = None
+    if args.cache_dir:
+        cache = ResponseCache(args.cache_dir, ttl=args.cache_ttl * 3600,
+                              max_bytes=int(args.cache_size * 1024 * 1024), offline=args.offline)
+    try:
+        if args.queue:
+            cache_options = None
+            if args.cache_dir:
+                cache_options = dict(directory=args.cache_dir, ttl=args.cache_ttl * 3600,
+                                     max_bytes=int(args.cache_size * 1024 * 1024), offline=args.offline)
+            seen_options = None
+            if args.seen_index:
+                seen_options = dict(path=args.seen_index, bloom_capacity=args.bloom, skip_written=False)
+            run_distributed(args.url, args.queue, args.output, role=args.role, workers=args.workers, shard=args.shard,
+                            page_param=args.page_param, max_pages=args.max_pages, state=state, cache=cache, seen=seen,
+                            lease_seconds=args.lease, worker_id=args.worker_id, backend=args.backend,
+                            selenium_fallback=not args.no_selenium_fallback, detail_template=args.detail_url_template,
+                            state_path=args.state, cache_options=cache_options, seen_options=seen_options,
+                            append=state is not None)
+            if args.excel and args.role != "coordinator" and os.path.exists(args.output):
+                build_excel(args.output, args.excel, normalize=not args.raw_excel)
+            return
+        with open_sink(args.output, append=state is not None, batch_size=args.batch_size) as sink:
+            if args.backend == "async":
+                run_async(args.url, None if args.all else args.max_projects, sink, state=state, cache=cache,
+                          detail_template=args.detail_url_template, page_param=args.page_param, max_pages=args.max_pages,
+                          fetch_concurrency=args.fetch_concurrency, parse_workers=args.parse_workers,
+                          queue_size=args.queue_size, seen=seen)
+            elif args.backend == "http":
+                run_http(args.url, None if args.all else args.max_projects, sink, selenium_fallback=not args.no_selenium_fallback,
+                         page_param=args.page_param, max_pages=args.max_pages, state=state, cache=cache,
+                         detail_template=args.detail_url_template, seen=seen)
+            elif args.workers > 1:
+                run_selenium_pool(args.url, args.max_projects, sink, args.workers, args.pool, state=state,
+                                  direct=args.direct, detail_template=args.detail_url_template, seen=seen)
+            elif args.direct:
+                run_selenium_direct(args.url, args.max_projects, sink, state=state, detail_template=args.detail_url_template,
+                                    seen=seen)
+            else:
+                run_selenium(args.url, args.max_projects, sink, state=state, seen=seen)
+    finally:
+        if state is not None:
+            state.close()
+        seen.close()
+        if cache is not None:
+            cache.close()
+        DRIVER_POOL.close()
+        print("\n" + METRICS.report())
+        if args.metrics_json:
+            with open(args.metrics_json, "w", encoding="utf-8") as f:
+                f.write(METRICS.to_json())
+        if args.metrics_prom:
+            with open(args.metrics_prom, "w", encoding="utf-8") as f:
+                f.write(METRICS.to_prometheus())
+    
+    if sink.count:
+        print(f"Successfully scraped {sink.count} projects. Data saved to {args.output}")
+    elif state is None:
+        print("No project data was collected")
+    if args.excel and (sink.count or state is not None) and os.path.exists(args.output):
+        build_excel(args.output, args.excel, normalize=not args.raw_excel)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,126 @@
+import os
+import sys
+import time
+import random
+from types import SimpleNamespace
+from urllib.parse import urlparse
+
+import pytest
+import requests
+from lxml import html as lxml_html
+from selenium.common.exceptions import InvalidSessionIdException
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tag00
+import benchmark
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+def rera_numbers(count):
+    """Return the sorted RERA numbers of the first count synthetic projects."""
+    return sorted(benchmark.synthetic_project(project_id)["rera_no"] for project_id in range(1, count + 1))
+
+@pytest.fixture(autouse=True)
+def no_pacing(monkeypatch):
+    """Run without request pacing or long retry backoff."""
+    monkeypatch.setattr(tag00.PACER, "min_interval", 0.0)
+    monkeypatch.setattr(tag00.PACER, "latency_factor", 0.0)
+    monkeypatch.setattr(tag00.RETRY_POLICY, "base_delay", 0.01)
+    monkeypatch.setattr(tag00.RETRY_POLICY.breaker, "cooldown", 0.05)
+
+@pytest.fixture
+def mock_site():
+    with benchmark.MockReraServer(count=20, per_page=9) as server:
+        yield server
+
+class FakeElement:
+    """Selenium WebElement stand-in backed by an lxml element."""
+    
+    def __init__(self, element):
+        self.element = element
+    
+    def get_attribute(self, name):
+        if name == "outerHTML":
+            return lxml_html.tostring(self.element, encoding="unicode")
+        return self.element.get(name)
+    
+    @property
+    def text(self):
+        return " ".join(self.element.text_content().split())
+
+class FakeBrowser:
+    """Chrome WebDriver stand-in that loads pages from the mock site over plain HTTP.
+    
+    Links resolved against the real RERA host are redirected to site. crash_after
+    makes every call after that many page loads fail like a dead browser session.
+    """
+    
+    def __init__(self, site, crash_after=None):
+        self.site = urlparse(site)
+        self.crash_after = crash_after
+        self.loads = 0
+        self.quit_called = False
+        self.page_source = "<html></html>"
+        self.current_url = None
+        self.window_handles = ["main"]
+        self.current_window_handle = "main"
+        self.switch_to = SimpleNamespace(window=lambda handle: None, new_window=lambda kind: None)
+    
+    def _check_alive(self):
+        if self.quit_called or (self.crash_after is not None and self.loads >= self.crash_after):
+            raise InvalidSessionIdException("invalid session id")
+    
+    def get(self, url):
+        self._check_alive()
+        self.loads += 1
+        url = urlparse(url)._replace(scheme=self.site.scheme, netloc=self.site.netloc).geturl()
+        time.sleep(random.uniform(0, 0.01))
+        self.page_source = requests.get(url, headers={"User-Agent": "FakeBrowser"}, timeout=10).text
+        self.current_url = url
+    
+    def refresh(self):
+        self.get(self.current_url)
+    
+    def find_elements(self, by, xpath):
+        self._check_alive()
+        return [FakeElement(element) for element in lxml_html.fromstring(self.page_source).xpath(xpath)]
+    
+    def execute_script(self, script, *args):
+        self._check_alive()
+    
+    def save_screenshot(self, path):
+        return True
+    
+    def close(self):
+        pass
+    
+    def quit(self):
+        self.quit_called = True
+
+class StartedBrowsers(list):
+    """FakeBrowsers started during a test; crash_after applies to the next one started."""
+    
+    crash_after = None
+
+@pytest.fixture
+def fake_browsers(monkeypatch, mock_site):
+    """Replace Chrome with FakeBrowsers on mock_site; yields the list of browsers started."""
+    started = StartedBrowsers()
+    
+    def setup_driver(block_resources=True):
+        browser = FakeBrowser(mock_site.list_url, started.crash_after)
+        started.crash_after = None
+        started.append(browser)
+        return browser
+    
+    monkeypatch.setattr(tag00, "setup_driver", setup_driver)
+    monkeypatch.setattr(tag00, "wait_for_page_ready", lambda driver, timeout=15, idle_time=0.5: True)
+    monkeypatch.setattr(tag00, "handle_popup", lambda driver, timeout=3: False)
+    monkeypatch.setattr(tag00, "DRIVER_POOL", tag00.DriverPool())
+    yield started
+    tag00.DRIVER_POOL.close()
@@ -0,0 +1,63 @@
+import threading
+import concurrent.futures
+
+import benchmark
+import tag00
+from conftest import rera_numbers
+
+def test_http_backend_scrapes_details_without_a_browser():
+    with benchmark.MockReraServer(count=9, per_page=9) as site:
+        sink = benchmark.TimingSink()
+        tag00.run_http(site.list_url, None, sink, selenium_fallback=False)
+    assert sorted(rera for rera, _ in sink.written) == rera_numbers(9)
+    assert sorted(site.detail_requests) == list(range(1, 10))
+
+def test_http_backend_crawls_every_listing_page(mock_site):
+    sink = benchmark.TimingSink()
+    tag00.run_http(mock_site.list_url, None, sink, selenium_fallback=False)
+    assert sorted(rera for rera, _ in sink.written) == rera_numbers(20)
+    assert len(mock_site.detail_requests) == 20
+
+def test_http_backend_stops_at_max_pages(mock_site):
+    sink = benchmark.TimingSink()
+    tag00.run_http(mock_site.list_url, None, sink, selenium_fallback=False, max_pages=2)
+    assert sorted(rera for rera, _ in sink.written) == rera_numbers(18)
+
+def test_async_backend_matches_http_backend(mock_site):
+    sink = benchmark.TimingSink()
+    tag00.run_async(mock_site.list_url, None, sink, fetch_concurrency=4, parse_workers=1)
+    assert sorted(rera for rera, _ in sink.written) == rera_numbers(20)
+
+def test_async_backend_stops_when_a_stage_fails(mock_site, capsys):
+    class BrokenSink(tag00.RecordSink):
+        attempts = 0
+        
+        def __init__(self):
+            super().__init__(None)
+        
+        def _write(self, record):
+            BrokenSink.attempts += 1
+            raise OSError("disk full")
+    
+    run = threading.Thread(target=tag00.run_async, args=(mock_site.list_url, None, BrokenSink()),
+                           kwargs={"fetch_concurrency": 2, "parse_workers": 1, "queue_size": 2}, daemon=True)
+    run.start()
+    run.join(timeout=30)
+    assert not run.is_alive()
+    assert BrokenSink.attempts == 1
+    assert "An error occurred: disk full" in capsys.readouterr().out
+    assert len(mock_site.detail_requests) < 20
+
+def test_async_parse_workers_are_not_forked(mock_site, monkeypatch):
+    contexts = []
+    
+    class RecordingExecutor(concurrent.futures.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            contexts.append(kwargs.get("mp_context"))
+            super().__init__(*args, **kwargs)
+    
+    monkeypatch.setattr(tag00, "ProcessPoolExecutor", RecordingExecutor)
+    sink = benchmark.TimingSink()
+    tag00.run_async(mock_site.list_url, None, sink, fetch_concurrency=4, parse_workers=2)
+    assert len(sink.written) == 20
+    assert contexts[0].get_start_method() in ("forkserver", "spawn")
@@ -0,0 +1,88 @@
+import time
+
+import pytest
+
+import benchmark
+import tag00
+
+class ConditionalSite(benchmark.MockReraServer):
+    """Mock site that tags pages with an ETag and answers matching conditional requests with 304."""
+    
+    etag = '"v1"'
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.statuses = []
+    
+    def handle(self, request):
+        if request.headers.get("If-None-Match") == self.etag:
+            self.statuses.append(304)
+            request.send_response(304)
+            request.send_header("ETag", self.etag)
+            request.end_headers()
+            return
+        self.statuses.append(200)
+        data = benchmark.render_listing(1, self.per_page, self.count).encode("utf-8")
+        request.send_response(200)
+        request.send_header("Content-Type", "text/html; charset=utf-8")
+        request.send_header("Content-Length", str(len(data)))
+        request.send_header("ETag", self.etag)
+        request.end_headers()
+        request.wfile.write(data)
+
+def test_cache_entries_expire_after_ttl(tmp_path):
+    cache = tag00.ResponseCache(str(tmp_path), ttl=0.1)
+    cache.put("http://x/a", "<html>a</html>")
+    assert cache.get("http://x/a")[:2] == ("<html>a</html>", True)
+    time.sleep(0.15)
+    assert cache.get("http://x/a")[:2] == ("<html>a</html>", False)
+    assert cache.get("http://x/a", tab="promoter") is None
+    cache.close()
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = tag00.ResponseCache(str(tmp_path), max_bytes=250)
+    for name in "abc":
+        cache.put(f"http://x/{name}", name * 100)
+        time.sleep(0.01)
+    assert cache.get("http://x/a") is None
+    cache.get("http://x/b")
+    time.sleep(0.01)
+    cache.put("http://x/d", "d" * 100)
+    assert cache.get("http://x/b") is not None
+    assert cache.get("http://x/c") is None
+    cache.close()
+
+def test_stale_entry_is_revalidated_with_a_conditional_request(tmp_path):
+    cache = tag00.ResponseCache(str(tmp_path), ttl=0.5)
+    session = tag00.setup_session()
+    with ConditionalSite(count=3) as site:
+        first = tag00.fetch_html(session, site.list_url, cache=cache)
+        assert tag00.fetch_html(session, site.list_url, cache=cache) == first
+        time.sleep(0.6)
+        assert tag00.fetch_html(session, site.list_url, cache=cache) == first
+        assert cache.get(site.list_url)[1]
+    assert site.statuses == [200, 304]
+    cache.close()
+
+def test_offline_mode_replays_the_cache_and_raises_on_misses(tmp_path):
+    cache = tag00.ResponseCache(str(tmp_path), ttl=0)
+    cache.put("http://127.0.0.1:9/a", "<html>a</html>")
+    offline = tag00.ResponseCache(str(tmp_path), ttl=0, offline=True)
+    session = tag00.setup_session()
+    assert tag00.fetch_html(session, "http://127.0.0.1:9/a", cache=offline) == "<html>a</html>"
+    with pytest.raises(tag00.CacheMiss):
+        tag00.fetch_html(session, "http://127.0.0.1:9/b", cache=offline)
+    cache.close()
+    offline.close()
+
+def test_http_backend_replays_a_crawl_offline(tmp_path, mock_site):
+    online, offline = benchmark.TimingSink(), benchmark.TimingSink()
+    cache = tag00.ResponseCache(str(tmp_path))
+    tag00.run_http(mock_site.list_url, None, online, selenium_fallback=False, cache=cache)
+    cache.close()
+    mock_site.detail_requests.clear()
+    cache = tag00.ResponseCache(str(tmp_path), offline=True)
+    tag00.run_http(mock_site.list_url, None, offline, selenium_fallback=False, cache=cache)
+    cache.close()
+    assert [rera for rera, _ in offline.written] == [rera for rera, _ in online.written]
+    assert len(offline.written) == 20 and not mock_site.detail_requests
@@ -0,0 +1,62 @@
+import benchmark
+import tag00
+
+def test_stable_project_key_normalises_rera_numbers():
+    card = {"rera_no": " rp / 01 /2025/01362", "project_id": "9"}
+    assert tag00.stable_project_key(card) == "RP/01/2025/01362"
+    assert tag00.stable_project_key({"rera_no": "Not found", "project_id": "9"}) == "id:9"
+
+def test_stable_project_key_hashes_cards_without_identifiers():
+    card = {"rera_no": "Not found", "project_id": "project_x", "project_name": "Green Vihar", "promoter": "B",
+            "address": "C"}
+    key = tag00.stable_project_key(card)
+    assert key.startswith("card:")
+    assert key == tag00.stable_project_key(dict(card, project_name="green  vihar"))
+    assert key != tag00.stable_project_key(dict(card, promoter="D"))
+
+def test_seen_index_dedups_in_memory_and_persists_written_keys(tmp_path):
+    path = str(tmp_path / "seen.txt")
+    seen = tag00.SeenIndex(path)
+    assert seen.add("A") and not seen.add("A") and seen.add("B")
+    seen.mark_written("A")
+    seen.close()
+    later = tag00.SeenIndex(path)
+    assert not later.add("A") and later.add("B")
+    later.close()
+    with_state = tag00.SeenIndex(path, skip_written=False)
+    assert with_state.add("A")
+    with_state.close()
+
+def test_bloom_seen_index_round_trips(tmp_path):
+    path = str(tmp_path / "seen.bloom")
+    seen = tag00.SeenIndex(path, bloom_capacity=1000)
+    for n in range(100):
+        assert seen.add(f"key-{n}")
+        seen.mark_written(f"key-{n}")
+    assert not seen.add("key-5")
+    seen.close()
+    later = tag00.SeenIndex(path, bloom_capacity=1000)
+    assert not later.add("key-42")
+    assert sum(later.add(f"other-{n}") for n in range(1000)) >= 990
+    later.close()
+
+def test_bloom_seen_indexes_sharing_a_file_keep_each_others_keys(tmp_path):
+    path = str(tmp_path / "seen.bloom")
+    first = tag00.SeenIndex(path, bloom_capacity=1000, skip_written=False)
+    second = tag00.SeenIndex(path, bloom_capacity=1000, skip_written=False)
+    first.mark_written("key-1")
+    second.mark_written("key-2")
+    first.close()
+    second.close()
+    later = tag00.SeenIndex(path, bloom_capacity=1000)
+    assert "key-1" in later and "key-2" in later
+    later.close()
+
+def test_http_backend_skips_projects_written_by_an_earlier_run(tmp_path, mock_site):
+    path = str(tmp_path / "seen.txt")
+    for expected in (20, 0):
+        sink = benchmark.TimingSink()
+        seen = tag00.SeenIndex(path)
+        tag00.run_http(mock_site.list_url, None, sink, selenium_fallback=False, seen=seen)
+        seen.close()
+        assert len(sink.written) == expected
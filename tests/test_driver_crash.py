@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+import benchmark
+import tag00
+from conftest import rera_numbers
+
+class JavascriptDetails(benchmark.MockReraServer):
+    """Mock site whose detail pages only carry the promoter pane when a browser loads them."""
+    
+    def handle(self, request):
+        if "/project-details/" in request.path and request.headers.get("User-Agent") != "FakeBrowser":
+            page = benchmark.render_detail(int(request.path.rsplit("/", 1)[1]))
+            self.respond(request, 200, page.split('<div class="tab-content">')[0] + "</body></html>")
+            return
+        super().handle(request)
+
+@pytest.fixture
+def mock_site():
+    with JavascriptDetails(count=12, per_page=6) as server:
+        yield server
+
+def test_direct_mode_replaces_a_crashed_browser(fake_browsers, mock_site):
+    fake_browsers.crash_after = 2
+    sink = benchmark.TimingSink()
+    tag00.run_selenium_direct(mock_site.list_url, float("inf"), sink)
+    assert sorted(rera for rera, _ in sink.written) == rera_numbers(6)
+    assert len(fake_browsers) == 2 and fake_browsers[0].quit_called
+
+def test_http_fallback_replaces_a_crashed_browser(fake_browsers, mock_site, tmp_path):
+    fake_browsers.crash_after = 1
+    output = str(tmp_path / "out.jsonl")
+    with tag00.open_sink(output) as sink:
+        tag00.run_http(mock_site.list_url, None, sink)
+    records = tag00.read_records(output).to_dict("records")
+    assert sorted(record["RERA Regd. No"] for record in records) == rera_numbers(12)
+    assert not any(tag00.needs_javascript(record) for record in records)
+    assert len(fake_browsers) == 2 and fake_browsers[0].quit_called
+
+def test_queue_worker_replaces_a_crashed_browser(fake_browsers, mock_site, tmp_path):
+    fake_browsers.crash_after = 1
+    output = str(tmp_path / "out.jsonl")
+    tag00.run_distributed(mock_site.list_url, str(tmp_path / "queue.db"), output, workers=1, backend="selenium",
+                          poll_interval=0.05)
+    with open(output, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert sorted(record["RERA Regd. No"] for record in records) == rera_numbers(12)
+    assert not any(tag00.needs_javascript(record) for record in records)
@@ -0,0 +1,36 @@
+import multiprocessing
+import os
+
+import tag00
+
+def test_pool_reuses_drivers_until_their_page_budget(fake_browsers):
+    pool = tag00.DriverPool(max_pages=2)
+    driver = pool.acquire()
+    assert not pool.track(driver)
+    pool.release(driver)
+    assert pool.acquire() is driver
+    assert pool.track(driver)
+    pool.release(driver)
+    assert driver.quit_called
+    assert pool.acquire() is not driver and len(fake_browsers) == 2
+
+def test_pool_does_not_need_fork_hooks(monkeypatch):
+    monkeypatch.delattr(os, "register_at_fork", raising=False)
+    assert tag00.DriverPool().max_pages == 50
+
+def _acquire_in_child(pool, started, result_queue):
+    driver = pool.acquire()
+    result_queue.put((len(started), driver.quit_called))
+    pool.close()
+
+def test_forked_child_starts_its_own_drivers(fake_browsers):
+    pool = tag00.DriverPool()
+    parent_driver = pool.acquire()
+    pool.release(parent_driver)
+    result_queue = multiprocessing.get_context("fork").Queue()
+    child = multiprocessing.get_context("fork").Process(target=_acquire_in_child,
+                                                         args=(pool, fake_browsers, result_queue))
+    child.start()
+    assert result_queue.get(timeout=30) == (2, False)
+    child.join()
+    assert pool.acquire() is parent_driver
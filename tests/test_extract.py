@@ -0,0 +1,25 @@
+from lxml import html as lxml_html
+
+import tag00
+from conftest import read_fixture
+
+def test_extract_fields_falls_back_through_rules_in_order():
+    page = read_fixture("project_detail.html")
+    rules = {"Promoter Name": ["//th[.='Company Name']/following-sibling::td",
+                               "//th[contains(text(), 'Name of Promoter')]/following-sibling::td"]}
+    assert tag00.extract_fields(page, rules) == {"Promoter Name": "SHREE INFRA PRIVATE LIMITED"}
+
+def test_extract_fields_accepts_a_parsed_element_and_defaults():
+    root = lxml_html.fromstring("<html><body><p> a </p></body></html>")
+    assert tag00.extract_fields(root, {"a": ["//p"], "b": ["//td"]}, default="-") == {"a": "a", "b": "-"}
+
+def test_parse_card_prefers_id_attributes():
+    element = lxml_html.fromstring('<div class="card project-card" data-id="77"><h5 class="card-title">X</h5>'
+                                   '<a href="/projects/project-details/5">View</a></div>')
+    card = tag00.parse_card(element)
+    assert card["project_id"] == "77"
+    assert card["project_name"] == "X" and card["promoter"] == "Not found"
+
+def test_parse_card_strips_the_by_prefix_from_promoters():
+    element = lxml_html.fromstring('<div class="card"><small>by  Utkal Homes</small></div>')
+    assert tag00.parse_card(element)["promoter"] == "Utkal Homes"
@@ -0,0 +1,51 @@
+import json
+
+import tag00
+from conftest import FakeBrowser
+
+def sample_metrics():
+    metrics = tag00.Metrics()
+    metrics.add_time("http_fetch", 0.25)
+    metrics.add_time("http_fetch", 0.75)
+    metrics.incr("http_response", status=200)
+    metrics.incr("http_response", 2, status=200)
+    metrics.incr("failure", category='say "hi"')
+    return metrics
+
+def test_metrics_json_has_spans_and_labelled_counters():
+    data = json.loads(sample_metrics().to_json())
+    assert data["spans"]["http_fetch"] == {"count": 2, "total": 1.0, "max": 0.75}
+    assert {"name": "http_response", "labels": {"status": 200}, "value": 3} in data["counters"]
+    assert data["elapsed_seconds"] >= 0
+
+def test_metrics_prometheus_exposition():
+    lines = sample_metrics().to_prometheus().splitlines()
+    assert "# TYPE rera_scraper_span_seconds summary" in lines
+    assert 'rera_scraper_span_seconds_sum{span="http_fetch"} 1.000000' in lines
+    assert 'rera_scraper_span_seconds_count{span="http_fetch"} 2' in lines
+    assert "# TYPE rera_scraper_http_response_total counter" in lines
+    assert 'rera_scraper_http_response_total{status="200"} 3' in lines
+    assert 'rera_scraper_failure_total{category="say \\"hi\\""} 1' in lines
+
+def test_metrics_report_lists_phases_and_counters():
+    report = sample_metrics().report()
+    assert "http_fetch" in report and "http_response [status=200]: 3" in report
+
+def test_extract_fields_counts_hits_and_misses_per_rule(monkeypatch):
+    metrics = tag00.Metrics()
+    monkeypatch.setattr(tag00, "METRICS", metrics)
+    tag00.extract_fields("<table><tr><th>GSTIN</th><td>X</td></tr></table>", {"GST No": tag00.DETAIL_RULES["GST No"]})
+    counters = {(c["labels"]["rule"], c["labels"]["result"]): c["value"] for c in metrics.snapshot()["counters"]}
+    assert counters == {(0, "miss"): 1, (1, "miss"): 1, (2, "hit"): 1}
+
+def test_wait_for_any_counts_hits_and_misses_per_rule(monkeypatch, mock_site):
+    metrics = tag00.Metrics()
+    monkeypatch.setattr(tag00, "METRICS", metrics)
+    browser = FakeBrowser(mock_site.list_url)
+    browser.page_source = "<html><body><a id='tab'>Promoter</a></body></html>"
+    xpaths = ["//button[@id='tab']", "//a[@id='tab']", "//span"]
+    assert tag00.wait_for_any(browser, xpaths, timeout=1, field="promoter_tab") is not None
+    assert tag00.wait_for_any(browser, xpaths[:1], timeout=0.2, field="promoter_tab") is None
+    counters = {(c["labels"]["field"], c["labels"]["rule"], c["labels"]["result"]): c["value"]
+                for c in metrics.snapshot()["counters"] if c["name"] == "selector"}
+    assert counters == {("promoter_tab", 0, "miss"): 2, ("promoter_tab", 1, "hit"): 1}
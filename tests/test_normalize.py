@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+import benchmark
+import tag00
+
+def test_gstin_checksum_matches_reference_implementation():
+    valid = [benchmark.synthetic_project(project_id)["gst"] for project_id in range(1, 50)]
+    corrupted = [gst[:-1] + ("0" if gst[-1] != "0" else "1") for gst in valid]
+    result = tag00.gstin_checksum_valid(pd.Series(valid + corrupted))
+    assert result.tolist() == [True] * len(valid) + [False] * len(corrupted)
+
+def test_normalize_records_cleans_and_splits_fields():
+    df = pd.DataFrame([
+        {"RERA Regd. No": "rp / 01 / 2025 / 01362", "Project Name": "  Basanti\n Enclave ",
+         "Promoter Name": "by SHREE INFRA", "Address of the Promoter": "Plot 12", "GST No": "21aaacs1234f1z4"},
+        {"RERA Regd. No": "Not found", "Project Name": "Lotus", "Promoter Name": "Tab not found",
+         "Address of the Promoter": "Tab not found", "GST No": "Not available without detail page"},
+        {"RERA Regd. No": "PS/19/2024/00057", "Project Name": "Green", "Promoter Name": "UTKAL",
+         "Address of the Promoter": "", "GST No": "21AAACS1234F1Z5"}
+    ])
+    out = tag00.normalize_records(df)
+    assert out.loc[0, "RERA Regd. No"] == "RP/01/2025/01362"
+    assert out.loc[0, "Project Name"] == "Basanti Enclave"
+    assert out.loc[0, "Promoter Name"] == "SHREE INFRA"
+    assert out.loc[0, "GST No"] == "21AAACS1234F1Z4"
+    assert (out.loc[0, "RERA Type"], out.loc[0, "RERA District"], out.loc[0, "RERA Year"], out.loc[0, "RERA Serial"]) == \
+        ("RP", 1, 2025, 1362)
+    assert out["GST Valid"].tolist()[0] is True and out["GST Valid"].tolist()[2] is False
+    assert out.loc[[1], ["RERA Regd. No", "Promoter Name", "GST No"]].isna().all(axis=None)
+    assert pd.isna(out.loc[1, "GST Valid"]) and pd.isna(out.loc[2, "Address of the Promoter"])
+    assert isinstance(out["Promoter Name"].dtype, pd.CategoricalDtype)
+    assert isinstance(out["RERA District"].dtype, pd.CategoricalDtype)
+
+@pytest.mark.parametrize("normalize", [True, False])
+def test_build_excel_keeps_latest_version_and_rows_without_rera(tmp_path, normalize):
+    source = tmp_path / "out.csv"
+    with tag00.open_sink(str(source)) as sink:
+        for name in ["Old", "New"]:
+            sink.write({"RERA Regd. No": "RP/01/2025/01362", "Project Name": name, "Promoter Name": "A",
+                        "Address of the Promoter": "B", "GST No": "Not found"})
+        for name in ["X", "Y"]:
+            sink.write({"RERA Regd. No": "Not found", "Project Name": name, "Promoter Name": "A",
+                        "Address of the Promoter": "B", "GST No": "Not found"})
+    tag00.build_excel(str(source), str(tmp_path / "out.xlsx"), normalize=normalize)
+    assert pd.read_excel(tmp_path / "out.xlsx")["Project Name"].tolist() == ["New", "X", "Y"]
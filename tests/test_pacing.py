@@ -0,0 +1,26 @@
+import time
+
+import tag00
+
+def test_pacer_interval_follows_measured_latency():
+    pacer = tag00.Pacer(min_interval=0.1, max_interval=2.0, latency_factor=2.0, smoothing=0.5)
+    assert pacer.interval() == 0.1
+    pacer.record(0.4)
+    assert pacer.interval() == 0.8
+    pacer.record(0.0)
+    assert pacer.avg_latency == 0.2 and pacer.interval() == 0.4
+    pacer.record(10.0)
+    assert pacer.interval() == 2.0
+
+def test_pacer_reserves_consecutive_slots():
+    pacer = tag00.Pacer(min_interval=0.05)
+    delays = [pacer.reserve() for _ in range(4)]
+    assert delays[0] == 0
+    assert [round(b - a, 2) for a, b in zip(delays, delays[1:])] == [0.05, 0.05, 0.05]
+
+def test_pacer_wait_spaces_requests():
+    pacer = tag00.Pacer(min_interval=0.05)
+    start = time.monotonic()
+    for _ in range(5):
+        pacer.wait()
+    assert time.monotonic() - start >= 0.19
@@ -0,0 +1,62 @@
+import tag00
+from conftest import read_fixture
+
+LIST_URL = "https://rera.odisha.gov.in/projects/project-list"
+
+def test_parse_project_cards_reads_every_card_field():
+    cards = tag00.parse_project_cards(read_fixture("project_list.html"), LIST_URL)
+    assert len(cards) == 3
+    first = cards[0]
+    assert first["rera_no"] == "RP/01/2025/01362"
+    assert first["project_name"] == "Basanti Enclave"
+    assert first["promoter"] == "SHREE INFRA PRIVATE LIMITED"
+    assert first["address"] == "Bhubaneswar, Khordha"
+    assert first["detail_url"] == "https://rera.odisha.gov.in/projects/project-details?id=1362"
+    assert first["project_id"] == "1362"
+
+def test_parse_card_takes_the_id_from_a_trailing_path_segment():
+    cards = tag00.parse_project_cards(read_fixture("project_list.html"), LIST_URL)
+    assert cards[1]["project_id"] == "57"
+    assert cards[1]["promoter"] == "KALINGA HOMES PRIVATE LIMITED"
+
+def test_parse_card_without_id_gets_a_deterministic_content_id():
+    first = tag00.parse_project_cards(read_fixture("project_list.html"), LIST_URL)[2]
+    second = tag00.parse_project_cards(read_fixture("project_list.html"), LIST_URL)[2]
+    assert first["rera_no"] == "Not found"
+    assert first["detail_url"] is None
+    assert first["project_id"].startswith("project_")
+    assert first["project_id"] == second["project_id"]
+    assert tag00.build_detail_url(first) is None
+
+def test_parse_project_details_normalises_whitespace():
+    record = tag00.parse_project_details(read_fixture("project_detail.html"))
+    assert record == {
+        "RERA Regd. No": "RP/01/2025/01362",
+        "Project Name": "Basanti Enclave",
+        "Promoter Name": "SHREE INFRA PRIVATE LIMITED",
+        "Address of the Promoter": "Plot 12, Saheed Nagar, Bhubaneswar",
+        "GST No": "21AAACS1234F1Z4"
+    }
+    assert not tag00.needs_javascript(record)
+
+def test_detail_page_without_promoter_data_needs_javascript():
+    record = tag00.parse_project_details(read_fixture("project_detail_js.html"))
+    assert record["RERA Regd. No"] == "RP/01/2025/01362"
+    assert tag00.needs_javascript(record)
+
+def test_card_to_record_and_fill_from_card():
+    card = tag00.parse_project_cards(read_fixture("project_list.html"), LIST_URL)[0]
+    record = tag00.card_to_record(card)
+    assert record["Promoter Name"] == "SHREE INFRA PRIVATE LIMITED"
+    assert record["GST No"] == "Not available without detail page"
+    filled = tag00.fill_from_card(dict(record, **{"RERA Regd. No": "Not found", "Project Name": "Not found"}), card)
+    assert filled["RERA Regd. No"] == "RP/01/2025/01362"
+    assert filled["Project Name"] == "Basanti Enclave"
+
+def test_find_next_page_url_skips_disabled_and_hash_links():
+    next_url = tag00.find_next_page_url(read_fixture("project_list.html"), LIST_URL)
+    assert next_url == LIST_URL + "?page=2"
+    assert tag00.find_next_page_url("<html><body></body></html>", LIST_URL) is None
+
+def test_with_page_param_replaces_the_page_number():
+    assert tag00.with_page_param(LIST_URL + "?page=1&q=x", "page", 3) == LIST_URL + "?page=3&q=x"
@@ -0,0 +1,81 @@
+import multiprocessing
+import os
+import queue
+import time
+import threading
+
+import pytest
+from selenium.common import exceptions
+
+import benchmark
+import tag00
+
+@pytest.mark.parametrize("pool_kind", ["thread", "process"])
+def test_pool_writes_records_in_listing_order(fake_browsers, mock_site, pool_kind):
+    sink = benchmark.TimingSink()
+    tag00.run_selenium_pool(mock_site.list_url, 100, sink, workers=3, pool_kind=pool_kind, direct=True)
+    assert [rera for rera, _ in sink.written] == [benchmark.synthetic_project(n)["rera_no"] for n in range(1, 10)]
+
+def test_open_listing_quits_the_driver_when_loading_fails(fake_browsers, mock_site, monkeypatch):
+    def fail(driver, url, timeout=15):
+        raise exceptions.TimeoutException("listing did not load")
+    
+    monkeypatch.setattr(tag00, "paced_get", fail)
+    with pytest.raises(exceptions.TimeoutException):
+        tag00._open_listing(mock_site.list_url)
+    assert len(fake_browsers) == 1 and fake_browsers[0].quit_called
+    assert not tag00.DRIVER_POOL.owns(fake_browsers[0])
+
+def test_worker_survives_a_stale_listing_before_it_has_a_driver(fake_browsers, mock_site, monkeypatch):
+    open_listing = tag00._open_listing
+    calls = []
+    
+    def flaky_open_listing(url):
+        calls.append(url)
+        if len(calls) == 1:
+            raise exceptions.StaleElementReferenceException("popup button went stale")
+        return open_listing(url)
+    
+    monkeypatch.setattr(tag00, "_open_listing", flaky_open_listing)
+    monkeypatch.setattr(tag00, "scrape_project_details", lambda driver, element, index: {"index": index})
+    task_queue, result_queue = queue.Queue(), queue.Queue()
+    task_queue.put((0, tag00.PROJECT_SELECTORS[0], 2, "3", 0))
+    worker = threading.Thread(target=tag00._pool_worker, args=(0, mock_site.list_url, task_queue, result_queue))
+    worker.start()
+    key, task = result_queue.get(timeout=30)
+    assert key == tag00.RETRY_TASK and task == (0, tag00.PROJECT_SELECTORS[0], 2, "3", 1)
+    task_queue.put(task)
+    assert result_queue.get(timeout=30) == (0, {"index": 1})
+    task_queue.put(None)
+    worker.join(timeout=30)
+    assert result_queue.get_nowait() == (None, 0)
+    assert len(calls) == 2
+
+def test_crashed_process_worker_is_replaced_and_its_project_requeued(fake_browsers, mock_site, monkeypatch, tmp_path):
+    marker = tmp_path / "crashed"
+    scrape = tag00.scrape_project_direct
+    
+    def crash_once(driver, card, detail_template=None):
+        if card["project_id"] == "4" and not marker.exists():
+            marker.touch()
+            os._exit(1)
+        return scrape(driver, card, detail_template)
+    
+    monkeypatch.setattr(tag00, "scrape_project_direct", crash_once)
+    sink = benchmark.TimingSink()
+    tag00.run_selenium_pool(mock_site.list_url, 100, sink, workers=2, pool_kind="process", direct=True)
+    assert marker.exists()
+    assert [rera for rera, _ in sink.written] == [benchmark.synthetic_project(n)["rera_no"] for n in range(1, 10)]
+
+def test_process_workers_share_one_pacer(fake_browsers, mock_site, monkeypatch):
+    monkeypatch.setattr(tag00.PACER, "min_interval", 0.05)
+    start = time.monotonic()
+    tag00.run_selenium_pool(mock_site.list_url, 100, benchmark.TimingSink(), workers=3, pool_kind="process", direct=True)
+    assert time.monotonic() - start >= 0.05 * 18
+
+def test_process_pool_falls_back_to_threads_without_fork(fake_browsers, mock_site, monkeypatch, capsys):
+    monkeypatch.setattr(multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+    sink = benchmark.TimingSink()
+    tag00.run_selenium_pool(mock_site.list_url, 100, sink, workers=2, pool_kind="process", direct=True)
+    assert len(sink.written) == 9
+    assert "using threads instead" in capsys.readouterr().out
@@ -0,0 +1,66 @@
+import pytest
+import requests
+import urllib3
+from selenium.common import exceptions
+
+import tag00
+
+@pytest.mark.parametrize("exc, category", [
+    (exceptions.NoSuchElementException("x"), "markup_change"),
+    (exceptions.InvalidSelectorException("x"), "markup_change"),
+    (exceptions.JavascriptException("x"), "markup_change"),
+    (exceptions.ElementClickInterceptedException("x"), "markup_change"),
+    (exceptions.StaleElementReferenceException("x"), "stale_dom"),
+    (exceptions.TimeoutException("x"), "timeout"),
+    (exceptions.InvalidSessionIdException("x"), "driver_crash"),
+    (exceptions.NoSuchWindowException("x"), "driver_crash"),
+    (urllib3.exceptions.MaxRetryError(None, "/session"), "driver_crash"),
+    (exceptions.WebDriverException("unknown error: chrome not reachable"), "driver_crash"),
+    (exceptions.WebDriverException("something else"), "unknown"),
+    (requests.ConnectionError("x"), "connection"),
+    (requests.Timeout("x"), "timeout"),
+])
+def test_classify_failure(exc, category):
+    assert tag00.classify_failure(exc) == category
+
+def test_retry_policy_only_retries_retryable_failures():
+    policy = tag00.RetryPolicy(max_attempts=3, base_delay=0.01)
+    assert policy.on_failure(exceptions.NoSuchElementException("x"), 0) is None
+    assert policy.on_failure(exceptions.TimeoutException("x"), 0) is not None
+    assert policy.on_failure(exceptions.TimeoutException("x"), 2) is None
+
+def test_backoff_is_capped():
+    policy = tag00.RetryPolicy(base_delay=1.0, max_delay=5.0)
+    assert all(0 <= policy.backoff(attempt) <= 5.0 for attempt in range(10))
+
+def test_retry_budget_caps_retries():
+    budget = tag00.RetryBudget(ratio=0.5, minimum=1)
+    budget.record_attempt()
+    budget.record_attempt()
+    assert [budget.spend() for _ in range(3)] == [True, True, False]
+
+def test_circuit_breaker_opens_after_threshold():
+    breaker = tag00.CircuitBreaker(failure_threshold=2, cooldown=0.05)
+    breaker.record_failure()
+    assert breaker.delay() == 0
+    breaker.record_failure()
+    assert breaker.delay() > 0.04
+    breaker.wait()
+    assert breaker.delay() == 0
+    breaker.record_failure()
+    assert breaker.delay() > 0.04, "a failed trial request reopens the breaker"
+    breaker.wait()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.delay() == 0
+
+def test_retry_call_retries_until_success():
+    calls = []
+    
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise requests.ConnectionError("reset")
+        return "ok"
+    
+    assert tag00.retry_call(flaky) == "ok" and len(calls) == 3
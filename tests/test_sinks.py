@@ -0,0 +1,100 @@
+from types import SimpleNamespace
+
+import pytest
+
+import tag00
+
+RECORD = {"RERA Regd. No": "RP/01/2025/01362", "Project Name": "Basanti Enclave", "Promoter Name": "SHREE INFRA",
+          "Address of the Promoter": "Plot 12", "GST No": "21AAACS1234F1Z4"}
+
+def records(count, start=0):
+    return [dict(RECORD, **{"RERA Regd. No": f"RP/01/2025/{n:05d}"}) for n in range(start, start + count)]
+
+@pytest.mark.parametrize("extension", [".csv", ".jsonl", ".parquet", ".db"])
+def test_sinks_round_trip(tmp_path, extension):
+    path = str(tmp_path / f"out{extension}")
+    with tag00.open_sink(path) as sink:
+        for record in records(3):
+            sink.write(record)
+    df = tag00.read_records(path)
+    assert df.to_dict("records") == records(3)
+
+@pytest.mark.parametrize("extension", [".csv", ".jsonl", ".db"])
+def test_sinks_append_to_earlier_output(tmp_path, extension):
+    path = str(tmp_path / f"out{extension}")
+    with tag00.open_sink(path) as sink:
+        sink.write(records(1)[0])
+    with tag00.open_sink(path, append=True) as sink:
+        sink.write(records(1, start=1)[0])
+    assert tag00.read_records(path)["RERA Regd. No"].tolist() == ["RP/01/2025/00000", "RP/01/2025/00001"]
+
+def test_csv_sink_writes_each_record_immediately(tmp_path):
+    path = tmp_path / "out.csv"
+    sink = tag00.open_sink(str(path))
+    sink.write(RECORD)
+    assert path.read_text(encoding="utf-8").count("\n") == 2
+    sink.close()
+
+def test_open_sink_rejects_unknown_formats(tmp_path):
+    with pytest.raises(ValueError):
+        tag00.open_sink(str(tmp_path / "out.xml"))
+
+def test_compact_record_reads_like_a_mapping():
+    record = tag00.ProjectRecord.from_mapping(RECORD)
+    assert record["GST No"] == RECORD["GST No"] and record.get("missing") is None
+    assert record.to_dict() == RECORD and list(record) == tag00.RECORD_FIELDS
+    assert tag00.StateStore.hash_of(record, tag00.RECORD_FIELDS) == tag00.StateStore.hash_of(RECORD, tag00.RECORD_FIELDS)
+
+@pytest.mark.parametrize("extension", [".csv", ".jsonl", ".parquet", ".db"])
+def test_sinks_round_trip_in_batches(tmp_path, extension):
+    path = str(tmp_path / f"out{extension}")
+    with tag00.open_sink(path, batch_size=3) as sink:
+        for record in records(7):
+            sink.write(record)
+    assert tag00.read_records(path).to_dict("records") == records(7)
+
+def test_memory_pressure_flushes_buffered_sinks(tmp_path, monkeypatch):
+    watchdog = tag00.MemoryWatchdog(limit_mb=1, interval=0)
+    monkeypatch.setattr(tag00, "MEMORY_WATCHDOG", watchdog)
+    path = str(tmp_path / "out.db")
+    sink = tag00.open_sink(path, batch_size=1000)
+    sink.write(RECORD)
+    assert watchdog.events == 1
+    assert len(tag00.read_records(path)) == 1
+    sink.close()
+
+def test_memory_watchdog_measures_this_process():
+    assert tag00.MemoryWatchdog.rss_mb() > 1
+    assert not tag00.MemoryWatchdog().check()
+
+def test_compact_record_interns_promoters_but_not_addresses():
+    first = tag00.ProjectRecord.from_mapping(dict(RECORD, **{"Promoter Name": "".join(["SHREE ", "INFRA"]),
+                                                             "Address of the Promoter": "".join(["Plot ", "12"])}))
+    second = tag00.ProjectRecord.from_mapping(dict(RECORD, **{"Promoter Name": "".join(["SHREE ", "INFRA"]),
+                                                              "Address of the Promoter": "".join(["Plot ", "12"])}))
+    assert first["Promoter Name"] is second["Promoter Name"]
+    assert first["Address of the Promoter"] is not second["Address of the Promoter"]
+
+def test_memory_watchdog_falls_back_to_psutil_without_proc(monkeypatch):
+    class Process:
+        def __init__(self, pid, rss=100 * 1024 * 1024):
+            self.rss = rss
+        
+        def children(self, recursive=False):
+            return [Process(None, 50 * 1024 * 1024)]
+        
+        def memory_info(self):
+            return SimpleNamespace(rss=self.rss)
+    
+    def no_proc(path):
+        raise FileNotFoundError(path)
+    
+    monkeypatch.setattr(tag00.os, "listdir", no_proc)
+    monkeypatch.setattr(tag00, "psutil", SimpleNamespace(Process=Process, Error=OSError))
+    assert tag00.MemoryWatchdog.rss_mb() == 150
+
+def test_memory_watchdog_warns_when_it_cannot_measure(monkeypatch, capsys):
+    monkeypatch.setattr(tag00.MemoryWatchdog, "rss_mb", staticmethod(lambda pid=None: None))
+    watchdog = tag00.MemoryWatchdog(limit_mb=1, interval=0)
+    assert not watchdog.check() and not watchdog.check()
+    assert capsys.readouterr().out.count("--memory-limit is not enforced") == 1
@@ -0,0 +1,54 @@
+from datetime import timedelta
+
+import pytest
+
+import benchmark
+import tag00
+
+CARD = {"rera_no": "RP/01/2025/01362", "project_id": "1362", "project_name": "Basanti Enclave",
+        "promoter": "SHREE INFRA", "address": "Khordha"}
+RECORD = {"RERA Regd. No": "RP/01/2025/01362", "Project Name": "Basanti Enclave", "Promoter Name": "SHREE INFRA",
+          "Address of the Promoter": "Plot 12", "GST No": "21AAACS1234F1Z4"}
+
+class FailingDetails(benchmark.MockReraServer):
+    """Mock site whose first three detail pages answer 503 until failing is cleared."""
+    
+    failing = True
+    
+    def handle(self, request):
+        if self.failing and "/project-details/" in request.path and int(request.path.rsplit("/", 1)[1]) <= 3:
+            self.respond(request, 503, "<html><body>Service Unavailable</body></html>")
+            return
+        super().handle(request)
+
+def test_state_store_skips_unchanged_cards(tmp_path):
+    with tag00.StateStore(str(tmp_path / "state.db")) as state:
+        assert state.needs_fetch(CARD)
+        state.mark_fetched(CARD, RECORD)
+        assert not state.needs_fetch(CARD)
+        assert state.needs_fetch(dict(CARD, project_name="Basanti Enclave Phase II"))
+
+def test_state_store_refetches_after_max_age(tmp_path):
+    with tag00.StateStore(str(tmp_path / "state.db"), max_age=timedelta(0)) as state:
+        state.mark_fetched(CARD, RECORD)
+        assert state.needs_fetch(CARD)
+
+@pytest.mark.parametrize("placeholder", [
+    tag00.card_to_record(CARD),
+    dict(RECORD, **{"Promoter Name": "Tab not found"}),
+    dict(RECORD, **{"Promoter Name": "Not found", "Address of the Promoter": "Not found", "GST No": "Not found"})
+])
+def test_state_store_does_not_mark_placeholder_records(tmp_path, placeholder):
+    assert tag00.is_placeholder_record(placeholder)
+    with tag00.StateStore(str(tmp_path / "state.db")) as state:
+        state.mark_fetched(CARD, placeholder)
+        assert state.needs_fetch(CARD)
+
+def test_failed_detail_fetches_are_retried_on_the_next_run(tmp_path):
+    with FailingDetails(count=9, per_page=9) as site:
+        for expected in (9, 3, 0):
+            sink = benchmark.TimingSink()
+            with tag00.StateStore(str(tmp_path / "state.db")) as state:
+                tag00.run_http(site.list_url, None, sink, selenium_fallback=False, state=state)
+            site.failing = False
+            assert len(sink.written) == expected
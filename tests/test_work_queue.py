@@ -0,0 +1,98 @@
+import json
+import time
+
+import benchmark
+import tag00
+from conftest import rera_numbers
+
+CARDS = [{"rera_no": f"RP/01/2025/{n:05d}", "project_id": str(n)} for n in range(3)]
+
+def test_claim_complete_and_drain(tmp_path):
+    queue = tag00.WorkQueue(str(tmp_path / "queue.db"))
+    assert not queue.start_run()
+    assert queue.enqueue("page:1", CARDS)
+    assert not queue.enqueue("page:1", CARDS)
+    task_id, cards = queue.claim("w1")
+    assert task_id == "page:1" and cards == CARDS
+    assert queue.claim("w2") is None
+    assert not queue.drained()
+    queue.seal()
+    assert not queue.drained()
+    queue.complete(task_id, "w1")
+    assert queue.drained() and queue.counts() == {"done": 1}
+    queue.close()
+
+def test_expired_lease_is_handed_to_another_worker(tmp_path):
+    queue = tag00.WorkQueue(str(tmp_path / "queue.db"), lease_seconds=0.2)
+    queue.enqueue("page:1", CARDS)
+    queue.claim("dead")
+    assert queue.claim("w2") is None
+    time.sleep(0.3)
+    assert queue.claim("w2")[0] == "page:1"
+    assert not queue.renew("page:1", "dead")
+    assert queue.renew("page:1", "w2")
+    queue.close()
+
+def test_failed_task_is_retried_then_parked(tmp_path):
+    queue = tag00.WorkQueue(str(tmp_path / "queue.db"), max_attempts=2)
+    queue.enqueue("page:1", CARDS)
+    for _ in range(2):
+        task_id, _ = queue.claim("w")
+        queue.fail(task_id, "w", "boom")
+    assert queue.counts() == {"failed": 1}
+    queue.close()
+
+def test_start_run_re_arms_finished_queue_and_resumes_unfinished_one(tmp_path):
+    path = str(tmp_path / "queue.db")
+    queue = tag00.WorkQueue(path)
+    queue.start_run()
+    queue.enqueue("page:1", CARDS)
+    queue.enqueue("page:2", CARDS)
+    queue.claim("w")
+    queue.complete("page:1", "w")
+    queue.mark_done("RP/01/2025/00000")
+    queue.seal()
+    assert queue.start_run()
+    assert queue.counts() == {"pending": 1} and queue.is_done("RP/01/2025/00000")
+    assert queue.enqueue("page:1", CARDS)
+    queue.claim("w")
+    queue.claim("w")
+    queue.complete("page:1", "w")
+    queue.complete("page:2", "w")
+    assert not queue.start_run()
+    assert queue.counts() == {} and not queue.is_done("RP/01/2025/00000")
+    queue.close()
+
+def test_rera_district():
+    assert tag00.rera_district({"rera_no": "RP/1/2025/01362"}) == "01"
+    assert tag00.rera_district({"rera_no": "Not found"}) is None
+
+def test_distributed_crawl_writes_each_project_once_per_run(mock_site, tmp_path):
+    output = str(tmp_path / "out.jsonl")
+    for _ in range(2):
+        tag00.run_distributed(mock_site.list_url, str(tmp_path / "queue.db"), output, workers=2, shard="district",
+                              selenium_fallback=False, poll_interval=0.05)
+        with open(output, encoding="utf-8") as f:
+            written = sorted(json.loads(line)["RERA Regd. No"] for line in f)
+        assert written == rera_numbers(20)
+
+def test_distributed_crawl_opens_output_through_sink_factory(mock_site, tmp_path):
+    assert ".timing" not in tag00.SINKS
+    output = str(tmp_path / "records.timing")
+    tag00.run_distributed(mock_site.list_url, str(tmp_path / "queue.db"), output, workers=2,
+                          sink_factory=benchmark.TimingSink, selenium_fallback=False, poll_interval=0.05)
+    with open(output, encoding="utf-8") as f:
+        assert sorted(line.split("\t")[0] for line in f) == rera_numbers(20)
+
+def test_distributed_crawl_records_written_keys_in_the_seen_index(mock_site, tmp_path):
+    path = str(tmp_path / "seen.txt")
+    tag00.run_distributed(mock_site.list_url, str(tmp_path / "queue.db"), str(tmp_path / "out.jsonl"), workers=2,
+                          selenium_fallback=False, poll_interval=0.05,
+                          seen_options=dict(path=path, skip_written=False))
+    with open(path, encoding="utf-8") as f:
+        assert len(set(f.read().split())) == 20
+    seen = tag00.SeenIndex(path)
+    sink = benchmark.TimingSink()
+    tag00.run_http(mock_site.list_url, None, sink, selenium_fallback=False, seen=seen)
+    seen.close()
+    assert sink.written == []